@@ -1,6 +1,16 @@
 import tkinter as tk
-from tkinter import simpledialog, messagebox, scrolledtext
+from tkinter import simpledialog, messagebox, scrolledtext, filedialog
+from bisect import bisect_left
 from collections import deque
+from itertools import islice
+from log_sink import LogSink
+import tree_io
+
+NODE_LEVELS = 5 # Deeper trees are stored heap-style in a HeapTree
+MAX_LEVELS = 20
+MIN_SPACING = 12 # Levels whose nodes would sit closer than this are not drawn
+TRAVERSAL_LINE = 20 # Values per log line when a traversal is streamed
+TRAVERSAL_PREVIEW = 50 # Values shown in the traversal popup
 
 class Node:
     def __init__(self, x=0, y=0):
@@ -24,29 +34,335 @@ def create_empty_tree(levels):
             queue.append(cur.right)
     return root
 
+def make_node(value, left, right):
+    """Node factory for tree_io.load."""
+    node = Node()
+    node.value = value
+    node.left = left
+    node.right = right
+    return node
+
+def tree_height(root):
+    height = 0
+    level = [root] if root else []
+    while level:
+        height += 1
+        level = [child for node in level for child in (node.left, node.right) if child]
+    return height
+
+class NodeTree:
+    """A tree of Node objects behind the same slot interface as HeapTree.
+
+    Slots are the Node objects themselves; None means no node.
+    """
+    shape_version = 0 # Bumped by trees that grow; these never change shape
+
+    def __init__(self, root):
+        self.root = root
+        self.levels = tree_height(root)
+
+    def value(self, node): return node.value
+    def set_value(self, node, value): node.value = value
+    def left(self, node): return node.left
+    def right(self, node): return node.right
+    def child(self, node, right): return node.right if right else node.left
+    def expand(self, node): return False
+    def collapsed(self, node): return False
+
+    def level_positions(self, depth, slots):
+        """(columns in the level, column of each slot): evenly packed, as before."""
+        return len(slots), range(len(slots))
+
+    def get_levels(self):
+        levels = []
+        if not self.root: return levels
+        queue = deque([(self.root, 0)])
+        while queue:
+            node, lvl = queue.popleft()
+            if lvl == len(levels): levels.append([])
+            levels[lvl].append(node)
+            if node.left: queue.append((node.left, lvl+1))
+            if node.right: queue.append((node.right, lvl+1))
+        return levels
+
+    def items(self):
+        """Yields (value, node) for every node that holds a value."""
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            if node.value is not None: yield node.value, node
+            if node.left: stack.append(node.left)
+            if node.right: stack.append(node.right)
+
+    def inorder(self): return morris_inorder(self.root)
+    def preorder(self): return morris_preorder(self.root)
+    def postorder(self): return morris_postorder(self.root)
+
+    def save(self, path):
+        return tree_io.save(path, self.root, key="value")
+
+class LazyNode(Node):
+    """A Node that knows its heap index, and so its depth and column."""
+    def __init__(self, index):
+        super().__init__()
+        self.index = index
+
+class LazyTree(NodeTree):
+    """A complete tree of `levels` levels in which only touched slots exist.
+
+    A node without children above the last level stands for a whole empty
+    subtree. Its two children are created when a click lands on it or a BST
+    insert passes through it, so memory follows the values entered rather
+    than 2^levels.
+    """
+    def __init__(self, levels, root=None):
+        self.root = root if root else (LazyNode(0) if levels > 0 else None)
+        self.levels = levels
+        self.shape_version = 0
+
+    @classmethod
+    def from_nodes(cls, root, levels):
+        """Copies a Node tree, giving every node its heap index."""
+        tree = cls(levels)
+        stack = [(root, tree.root)] if root else []
+        while stack:
+            node, copy = stack.pop()
+            copy.value = node.value
+            if node.left or node.right:
+                tree.expand(copy)
+                if node.left: stack.append((node.left, copy.left))
+                if node.right: stack.append((node.right, copy.right))
+        return tree
+
+    @staticmethod
+    def depth(node):
+        return (node.index + 1).bit_length() - 1
+
+    def collapsed(self, node):
+        return node.left is None and self.depth(node) < self.levels - 1
+
+    def expand(self, node):
+        """Materializes node's two (empty) children. False if there is nothing to expand."""
+        if not self.collapsed(node):
+            return False
+        node.left = LazyNode(2 * node.index + 1)
+        node.right = LazyNode(2 * node.index + 2)
+        self.shape_version += 1
+        return True
+
+    def child(self, node, right):
+        self.expand(node)
+        return node.right if right else node.left
+
+    def level_positions(self, depth, slots):
+        """Slots keep their column in the full level, so the shape reads correctly."""
+        first = (1 << depth) - 1
+        return 1 << depth, [node.index - first for node in slots]
+
+class HeapTree:
+    """A complete binary tree stored implicitly in one flat list.
+
+    Slot i holds a value (or None for "?") and its children are slots 2i+1
+    and 2i+2, so there are no per-node objects, links or coordinates and a
+    20-level tree is one list of about a million entries.
+    """
+    shape_version = 0
+
+    def __init__(self, levels):
+        self.levels = levels
+        self.values = [None] * ((1 << levels) - 1)
+        self.root = 0 if levels > 0 else None
+
+    @classmethod
+    def from_nodes(cls, root):
+        """Copies a Node tree into heap slots; missing nodes become empty slots."""
+        tree = cls(tree_height(root))
+        values = tree.values
+        stack = [(root, 0)] if root else []
+        while stack:
+            node, i = stack.pop()
+            values[i] = node.value
+            if node.left: stack.append((node.left, 2 * i + 1))
+            if node.right: stack.append((node.right, 2 * i + 2))
+        return tree
+
+    def value(self, i): return self.values[i]
+    def set_value(self, i, value): self.values[i] = value
+
+    def left(self, i):
+        child = 2 * i + 1
+        return child if child < len(self.values) else None
+
+    def right(self, i):
+        child = 2 * i + 2
+        return child if child < len(self.values) else None
+
+    def child(self, i, right): return self.right(i) if right else self.left(i)
+    def expand(self, i): return False
+    def collapsed(self, i): return False
+
+    def level_positions(self, depth, slots):
+        return len(slots), range(len(slots))
+
+    def get_levels(self):
+        """Level d is the slot range [2^d - 1, 2^(d+1) - 1)."""
+        return [range((1 << d) - 1, (1 << (d + 1)) - 1) for d in range(self.levels)]
+
+    def items(self):
+        for i, value in enumerate(self.values):
+            if value is not None: yield value, i
+
+    def inorder(self):
+        values, n = self.values, len(self.values)
+        stack = []
+        i = 0
+        while stack or i < n:
+            while i < n:
+                stack.append(i)
+                i = 2 * i + 1
+            i = stack.pop()
+            if values[i] is not None: yield values[i]
+            i = 2 * i + 2
+
+    def preorder(self):
+        values, n = self.values, len(self.values)
+        stack = [0] if n else []
+        while stack:
+            i = stack.pop()
+            if values[i] is not None: yield values[i]
+            if 2 * i + 2 < n: stack.append(2 * i + 2)
+            if 2 * i + 1 < n: stack.append(2 * i + 1)
+
+    def postorder(self):
+        values, n = self.values, len(self.values)
+        stack = [(0, False)] if n else []
+        while stack:
+            i, children_done = stack.pop()
+            if children_done or 2 * i + 1 >= n:
+                if values[i] is not None: yield values[i]
+            else:
+                stack.append((i, True))
+                stack.append((2 * i + 2, False))
+                stack.append((2 * i + 1, False))
+
+    def save(self, path):
+        return tree_io.save_heap(path, self.values)
+
 # Traversal Logic
+# The list versions keep their old signature but no longer recurse, so deep
+# trees cannot hit the recursion limit.
 def inorder(node, result):
-    if node:
-        inorder(node.left, result)
-        if node.value is not None: result.append(node.value)
-        inorder(node.right, result)
+    result.extend(morris_inorder(node))
 
 def preorder(node, result):
-    if node:
-        if node.value is not None: result.append(node.value)
-        preorder(node.left, result)
-        preorder(node.right, result)
+    result.extend(morris_preorder(node))
 
 def postorder(node, result):
-    if node:
-        postorder(node.left, result)
-        postorder(node.right, result)
-        if node.value is not None: result.append(node.value)
+    result.extend(morris_postorder(node))
+
+# Morris (threaded) traversals: O(1) extra space. They temporarily point the
+# right link of each left subtree's last node back up at its ancestor and
+# remove every thread again, even if the caller stops iterating early, so
+# the tree must not be edited while one is in progress.
+def morris_inorder(node):
+    closing = False # Set once the consumer closes us; we then just finish unthreading
+    while node:
+        if node.left:
+            pred = node.left
+            while pred.right and pred.right is not node:
+                pred = pred.right
+            if pred.right is None:
+                pred.right = node # Thread, then go left
+                node = node.left
+                continue
+            pred.right = None # Second visit: left subtree done
+        if node.value is not None and not closing:
+            try:
+                yield node.value
+            except GeneratorExit:
+                closing = True
+        node = node.right
+
+def morris_preorder(node):
+    closing = False
+    while node:
+        if node.left:
+            pred = node.left
+            while pred.right and pred.right is not node:
+                pred = pred.right
+            if pred.right is None:
+                pred.right = node
+                if node.value is not None and not closing:
+                    try:
+                        yield node.value
+                    except GeneratorExit:
+                        closing = True
+                node = node.left
+                continue
+            pred.right = None
+        elif node.value is not None and not closing:
+            try:
+                yield node.value
+            except GeneratorExit:
+                closing = True
+        node = node.right
+
+def _reverse_right_chain(start, end):
+    """Reverses the right links from start to end in place."""
+    prev, node = None, start
+    while prev is not end:
+        node.right, prev, node = prev, node, node.right
+
+def morris_postorder(node):
+    """Postorder in O(1) space: when a left subtree is finished, the right
+    chain from its root to the threaded node is emitted bottom-up by
+    reversing it in place and back."""
+    closing = False
+    dummy = Node()
+    dummy.left = node
+    node = dummy
+    while node:
+        if node.left:
+            pred = node.left
+            while pred.right and pred.right is not node:
+                pred = pred.right
+            if pred.right is None:
+                pred.right = node
+                node = node.left
+                continue
+            pred.right = None
+            _reverse_right_chain(node.left, pred)
+            cur = pred
+            while True:
+                if cur.value is not None and not closing:
+                    try:
+                        yield cur.value
+                    except GeneratorExit:
+                        closing = True
+                if cur is node.left:
+                    break
+                cur = cur.right
+            _reverse_right_chain(pred, node.left)
+        node = node.right
 
 class TreeApp:
-    def __init__(self, levels, min_val, max_val):
-        self.root_node = create_empty_tree(levels)
-        self.levels = levels
+    def __init__(self, levels, min_val, max_val, lazy=False):
+        # Small trees keep one Node per slot; deep ones use the implicit heap
+        # layout, or create their slots only as they are used
+        if lazy:
+            self.tree = LazyTree(levels)
+        elif levels > NODE_LEVELS:
+            self.tree = HeapTree(levels)
+        else:
+            self.tree = NodeTree(create_empty_tree(levels))
+        self.value_index = {} # value -> slot holding it, kept in sync with every edit
+        self.layout = [] # (y, radius, xs, slots) per drawn level
+        self.slot_pos = {} # slot -> (x, y, radius) for drawn slots
+        self.level_ys = [] # y of each drawn level, the first key of the hit-test index
+        self.layout_key = None # (canvas size, tree, shape version) the layout was computed for
+        self.hidden_levels = 0 # Levels too dense to draw
+        self.text_items = {} # slot -> canvas id of its label, for in-place value edits
+        self.highlighted = None # Value ringed by "Find Value"
         self.min_val = min_val
         self.max_val = max_val
         self.node_radius = 22
@@ -76,6 +392,7 @@ class TreeApp:
 
         self.canvas.bind("<Button-1>", self.on_click)
         self.canvas.bind("<Button-3>", self.on_right_click)
+        self.canvas.bind("<Configure>", self.on_resize)
         
         self.write_log("System initialized.")
         self.write_log(f"Range: {self.min_val} - {self.max_val}")
@@ -101,9 +418,16 @@ class TreeApp:
 
         # BST Operations
         self.add_side_button("BST Auto-Insert", self.bst_insert_prompt, color="#43a047")
+        self.add_side_button("Find Value", self.find_value_prompt, color="#43a047")
         
         tk.Frame(self.sidebar, height=2, bg="#444").pack(fill=tk.X, pady=15)
 
+        # Save / Open (compact binary format, see tree_io)
+        self.add_side_button("Save Tree", self.save_tree, color="#6d6d8a")
+        self.add_side_button("Open Tree", self.open_tree, color="#6d6d8a")
+
+        tk.Frame(self.sidebar, height=2, bg="#444").pack(fill=tk.X, pady=15)
+
         # --- LOGGING AREA ---
         tk.Label(self.sidebar, text="System Logs", font=("Segoe UI", 10, "bold"), 
                  bg=self.bg_panel, fg=self.accent).pack(anchor="w", pady=(0, 5))
@@ -113,6 +437,7 @@ class TreeApp:
                                                  font=("Consolas", 9), relief=tk.FLAT)
         self.log_area.pack(fill=tk.BOTH, expand=True)
         self.log_area.configure(state='disabled')
+        self.log_sink = LogSink(self.log_area, prefix="> ")
 
     def add_side_button(self, text, command, color=None):
         btn = tk.Button(self.sidebar, text=text, command=command, 
@@ -122,77 +447,137 @@ class TreeApp:
         btn.pack(fill=tk.X, pady=5)
 
     def write_log(self, message):
-        """Adds a message to the sidebar log area."""
-        self.log_area.configure(state='normal')
-        self.log_area.insert(tk.END, f"> {message}\n")
-        self.log_area.see(tk.END)
-        self.log_area.configure(state='disabled')
-        print(message) # Keep terminal output as backup
+        """Queues a message for the sidebar log area (and the terminal)."""
+        self.log_sink.write(message)
 
     def draw_tree(self):
-        levels = self.get_levels(self.root_node)
-        spacing_y = 120
-        canvas_width = self.canvas.winfo_width()
-        if canvas_width < 100: canvas_width = 800
+        self.compute_layout()
+        tree = self.tree
+        pos = self.slot_pos
+        self.canvas.delete("all")
+
+        line_settings = {"fill": "#44475a", "width": 2}
+        for _, _, _, slots in self.layout:
+            for slot in slots:
+                x, y, r = pos[slot]
+                if tree.collapsed(slot):
+                    # Placeholder for an empty subtree that has not been created yet
+                    self.canvas.create_polygon(x, y, x-r, y+2.5*r, x+r, y+2.5*r, fill="",
+                                               outline="#6c6c8a", dash=(3, 2))
+                    continue
+                for child in (tree.left(slot), tree.right(slot)):
+                    if child is not None and child in pos:
+                        cx, cy, _ = pos[child]
+                        self.canvas.create_line(x, y, cx, cy, **line_settings)
+
+        self.text_items = {}
+        for y, r, xs, slots in self.layout:
+            for x, slot in zip(xs, slots):
+                item = self.draw_node(x, y, r, tree.value(slot))
+                if item is not None:
+                    self.text_items[slot] = item
+
+        if self.hidden_levels:
+            y = self.layout[-1][0] + 3 * self.node_radius if self.layout else 40
+            self.canvas.create_text(self.canvas_size()[0] // 2, y, fill="#a0a0a0", font=("Segoe UI", 10),
+                                    text=f"{self.hidden_levels} deeper levels not drawn")
+        if self.highlighted in self.value_index:
+            self.draw_highlight(self.value_index[self.highlighted])
+
+    def update_slot(self, slot):
+        """Shows a value edit: just that node's label when the layout still holds."""
+        tree = self.tree
+        if self.layout_key != (self.canvas_size(), tree, tree.shape_version):
+            self.draw_tree()
+            return
+        item = self.text_items.get(slot)
+        if item is not None:
+            value = tree.value(slot)
+            self.canvas.itemconfigure(item, text=str(value) if value is not None else "?")
+        if self.highlighted in self.value_index:
+            self.draw_highlight(self.value_index[self.highlighted])
+        else:
+            self.canvas.delete("highlight")
 
-        for depth, nodes in enumerate(levels):
-            spacing_x = canvas_width // (len(nodes) + 1)
-            for i, node in enumerate(nodes):
-                node.x = (i + 1) * spacing_x
-                node.y = (depth + 1) * spacing_y
+    def on_resize(self, event):
+        if self.layout_key is not None and self.layout_key[0] != self.canvas_size():
+            self.draw_tree()
 
-        self.canvas.delete("all")
-        self.draw_connections(self.root_node)
-        self.draw_nodes(self.root_node)
+    def canvas_size(self):
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        return (width if width >= 100 else 800), (height if height >= 100 else 750)
+
+    def compute_layout(self):
+        """Spaces each level's slots evenly across the canvas.
+
+        Only levels whose nodes would sit at least MIN_SPACING apart are laid
+        out, so a deep tree shows its top levels instead of millions of ovals.
+        Positions depend only on the tree's shape and the canvas size, so the
+        layout (and the hit-test index built with it) is reused until one of
+        those changes.
+        """
+        tree = self.tree
+        size = self.canvas_size()
+        key = (size, tree, tree.shape_version)
+        if key == self.layout_key:
+            return
+        self.layout_key = key
+        canvas_width, canvas_height = size
+        levels = tree.get_levels()
+        columns = [tree.level_positions(depth, slots) for depth, slots in enumerate(levels)]
+        drawn = 0
+        while drawn < len(levels) and canvas_width // (columns[drawn][0] + 1) >= MIN_SPACING:
+            drawn += 1
+        self.hidden_levels = len(levels) - drawn
+        spacing_y = min(120, canvas_height // (drawn + 1))
+
+        self.layout = []
+        self.slot_pos = {}
+        for depth, slots in enumerate(levels[:drawn]):
+            width, offsets = columns[depth]
+            spacing_x = canvas_width // (width + 1)
+            r = min(self.node_radius, spacing_x // 2 - 2)
+            y = (depth + 1) * spacing_y
+            xs = [(i + 1) * spacing_x for i in offsets]
+            self.layout.append((y, r, xs, slots))
+            for x, slot in zip(xs, slots):
+                self.slot_pos[slot] = (x, y, r)
+        self.level_ys = [level[0] for level in self.layout]
         
-    def check_duplicate(self, node, value):
-        """Recursively checks if a value exists anywhere in the tree."""
-        if not node: 
-            return False
-        if node.value == value: 
-            return True
-        return self.check_duplicate(node.left, value) or self.check_duplicate(node.right, value)
+    def check_duplicate(self, value):
+        """Checks if a value exists anywhere in the tree, in O(1) via the index."""
+        return value in self.value_index
 
-    def get_levels(self, root):
-        levels = []
-        if not root: return levels
-        queue = deque([(root, 0)])
-        while queue:
-            node, lvl = queue.popleft()
-            if lvl == len(levels): levels.append([])
-            levels[lvl].append(node)
-            if node.left: queue.append((node.left, lvl+1))
-            if node.right: queue.append((node.right, lvl+1))
-        return levels
+    def rebuild_index(self):
+        """Recomputes value_index from scratch (after the whole tree is replaced)."""
+        self.value_index = dict(self.tree.items())
 
-    def draw_connections(self, node):
-        if not node: return
-        line_settings = {"fill": "#44475a", "width": 2}
-        if node.left:
-            self.canvas.create_line(node.x, node.y, node.left.x, node.left.y, **line_settings)
-            self.draw_connections(node.left)
-        if node.right:
-            self.canvas.create_line(node.x, node.y, node.right.x, node.right.y, **line_settings)
-            self.draw_connections(node.right)
-
-    def draw_nodes(self, node):
-        if not node: return
-        r = self.node_radius
+    def draw_node(self, x, y, r, value):
         # Shadow effect
-        self.canvas.create_oval(node.x-r+2, node.y-r+2, node.x+r+2, node.y+r+2, fill="#000000", outline="")
+        self.canvas.create_oval(x-r+2, y-r+2, x+r+2, y+r+2, fill="#000000", outline="")
         # Main Node
-        self.canvas.create_oval(node.x-r, node.y-r, node.x+r, node.y+r, fill=self.node_color, outline=self.text_color)
+        self.canvas.create_oval(x-r, y-r, x+r, y+r, fill=self.node_color, outline=self.text_color)
         
-        text = str(node.value) if node.value is not None else "?"
-        self.canvas.create_text(node.x, node.y, text=text, fill=self.text_color, font=("Segoe UI", 11, "bold"))
-        
-        self.draw_nodes(node.left)
-        self.draw_nodes(node.right)
+        if r >= 12: # Labels would not fit in smaller nodes
+            text = str(value) if value is not None else "?"
+            return self.canvas.create_text(x, y, text=text, fill=self.text_color, font=("Segoe UI", 11, "bold"))
+        return None
+
+    def draw_highlight(self, slot):
+        self.canvas.delete("highlight")
+        if slot not in self.slot_pos:
+            return
+        x, y, r = self.slot_pos[slot]
+        r += 5
+        self.canvas.create_oval(x-r, y-r, x+r, y+r, outline="#ffd54f", width=3, tags="highlight")
 
     def on_click(self, event):
-        clicked_node = self.find_clicked_node(self.root_node, event.x, event.y)
+        clicked = self.find_clicked_node(event.x, event.y)
         
-        if clicked_node:
+        if clicked is not None:
+            if self.tree.expand(clicked):
+                self.draw_tree() # Show the new empty children before asking
+            current = self.tree.value(clicked)
             # Get input from user
             value = simpledialog.askinteger("Input", f"Enter ({self.min_val}-{self.max_val}):")
             
@@ -204,48 +589,73 @@ class TreeApp:
                     return
 
                 # 2. Check Duplicates (Skip check if user entered the same number that was already there)
-                if value != clicked_node.value and self.check_duplicate(self.root_node, value):
+                if value != current and self.check_duplicate(value):
                     self.write_log(f"Error: {value} already exists!")
                     messagebox.showwarning("Duplicate", f"The value {value} is already in the tree.")
                     return
 
                 # 3. Success - Update Node
-                prev_val = clicked_node.value
-                clicked_node.value = value
-                self.write_log(f"Manual Update: Changed {prev_val} to {value}")
-                self.draw_tree()
+                self.value_index.pop(current, None)
+                self.tree.set_value(clicked, value)
+                self.value_index[value] = clicked
+                self.write_log(f"Manual Update: Changed {current} to {value}")
+                self.update_slot(clicked)
 
     def on_right_click(self, event):
-        clicked_node = self.find_clicked_node(self.root_node, event.x, event.y)
-        if clicked_node:
-            prev_val = clicked_node.value
-            clicked_node.value = None
+        clicked = self.find_clicked_node(event.x, event.y)
+        if clicked is not None:
+            prev_val = self.tree.value(clicked)
+            self.value_index.pop(prev_val, None)
+            self.tree.set_value(clicked, None)
             self.write_log(f"Cleared Node (was {prev_val})")
-            self.draw_tree()
+            self.update_slot(clicked)
+
+    def find_clicked_node(self, x, y):
+        """Returns the drawn slot under (x, y), or None, in O(log n).
+
+        Bisects the level ys for the nearest level, then that level's sorted
+        xs for the nearest slot; nodes never overlap, so the nearest one is
+        the only candidate.
+        """
+        level = self.nearest(self.level_ys, y)
+        if level is None:
+            return None
+        level_y, r, xs, slots = self.layout[level]
+        i = self.nearest(xs, x)
+        if abs(y - level_y) <= r + 3 and abs(x - xs[i]) <= r + 3:
+            return slots[i]
+        return None
 
-    def find_clicked_node(self, node, x, y):
-        if not node: return None
-        if (node.x-25 <= x <= node.x+25) and (node.y-25 <= y <= node.y+25):
-            return node
-        return self.find_clicked_node(node.left, x, y) or self.find_clicked_node(node.right, x, y)
-
-    def bst_insert(self, node, value):
-        if node.value is None:
-            node.value = value
-            return True
-        if value == node.value: return False
-        if value < node.value:
-            return self.bst_insert(node.left, value) if node.left else False
-        else:
-            return self.bst_insert(node.right, value) if node.right else False
+    @staticmethod
+    def nearest(values, target):
+        """Index of the value closest to target in a sorted list, or None if empty."""
+        i = bisect_left(values, target)
+        if i == len(values):
+            return i - 1 if values else None
+        if i > 0 and target - values[i - 1] < values[i] - target:
+            return i - 1
+        return i
+
+    def bst_insert(self, slot, value):
+        if value in self.value_index: return False # Duplicates anywhere, not just on the path
+        tree = self.tree
+        while slot is not None:
+            current = tree.value(slot)
+            if current is None:
+                tree.set_value(slot, value)
+                self.value_index[value] = slot
+                return True
+            if value == current: return False
+            slot = tree.child(slot, value > current)
+        return False # Ran out of slots
 
     def bst_insert_prompt(self):
         val = simpledialog.askinteger("BST Insert", "Value:")
         if val is not None:
             if self.min_val <= val <= self.max_val:
-                if self.bst_insert(self.root_node, val):
+                if self.bst_insert(self.tree.root, val):
                     self.write_log(f"BST Inserted: {val}")
-                    self.draw_tree()
+                    self.update_slot(self.value_index[val])
                 else:
                     self.write_log(f"Insert Failed: {val} (Duplicate or No Space)")
                     messagebox.showwarning("Warning", "Could not insert (Duplicate or no space)")
@@ -253,26 +663,104 @@ class TreeApp:
                 self.write_log(f"Insert Failed: {val} (Out of Range)")
                 messagebox.showerror("Error", "Out of range")
 
+    def find_value_prompt(self):
+        val = simpledialog.askinteger("Find Value", "Value:")
+        if val is None:
+            return
+        slot = self.value_index.get(val)
+        if slot is None:
+            self.write_log(f"Find: {val} is not in the tree")
+            messagebox.showinfo("Find Value", f"{val} is not in the tree")
+            return
+        self.highlighted = val
+        self.draw_highlight(slot)
+        if slot in self.slot_pos:
+            self.write_log(f"Found {val}")
+        else:
+            self.write_log(f"Found {val} (below the drawn levels)")
+
+    def save_tree(self):
+        path = filedialog.asksaveasfilename(title="Save tree", defaultextension=tree_io.TREE_EXT,
+                                            filetypes=[("Saved trees", "*" + tree_io.TREE_EXT)])
+        if not path:
+            return
+        try:
+            count = self.tree.save(path)
+        except (OSError, ValueError) as e:
+            self.write_log(f"Save Failed: {e}")
+            messagebox.showerror("Error", str(e))
+            return
+        self.write_log(f"Saved {count} nodes to {path}")
+
+    def open_tree(self):
+        path = filedialog.askopenfilename(title="Open tree",
+                                          filetypes=[("Saved trees", "*" + tree_io.TREE_EXT), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            root = tree_io.load(path, make_node)
+        except (OSError, ValueError) as e:
+            self.write_log(f"Open Failed: {e}")
+            messagebox.showerror("Error", str(e))
+            return
+
+        values = list(morris_inorder(root))
+        if len(set(values)) != len(values) or any(not (self.min_val <= v <= self.max_val) for v in values):
+            self.write_log(f"Open Failed: {path} has duplicates or out-of-range values")
+            messagebox.showerror("Error", "The saved tree does not fit the current range")
+            return
+
+        height = tree_height(root)
+        if height > MAX_LEVELS:
+            self.write_log(f"Open Failed: {path} has {height} levels (max {MAX_LEVELS})")
+            messagebox.showerror("Error", f"Trees deeper than {MAX_LEVELS} levels are not supported")
+            return
+
+        # Keep the current storage: heap slots (gaps become "?"), lazy slots or Node objects
+        if isinstance(self.tree, HeapTree):
+            self.tree = HeapTree.from_nodes(root)
+        elif isinstance(self.tree, LazyTree):
+            self.tree = LazyTree.from_nodes(root, max(height, self.tree.levels))
+        else:
+            self.tree = NodeTree(root)
+        self.rebuild_index()
+        self.write_log(f"Opened {path}: {self.tree.levels} levels, {len(values)} values")
+        self.draw_tree()
+
     def show_inorder(self):
-        arr = []
-        inorder(self.root_node, arr)
-        res = " , ".join(map(str, arr))
-        self.write_log(f"Inorder: [{res}]")
-        messagebox.showinfo("Inorder Traversal", res)
+        self.show_traversal("Inorder", self.tree.inorder())
 
     def show_preorder(self):
-        arr = []
-        preorder(self.root_node, arr)
-        res = " , ".join(map(str, arr))
-        self.write_log(f"Preorder: [{res}]")
-        messagebox.showinfo("Preorder Traversal", res)
+        self.show_traversal("Preorder", self.tree.preorder())
 
     def show_postorder(self):
-        arr = []
-        postorder(self.root_node, arr)
-        res = " , ".join(map(str, arr))
-        self.write_log(f"Postorder: [{res}]")
-        messagebox.showinfo("Postorder Traversal", res)
+        self.show_traversal("Postorder", self.tree.postorder())
+
+    def show_traversal(self, name, values):
+        """Streams a traversal into the log a line at a time.
+
+        Nothing holds the whole traversal: the log keeps its last lines and the
+        popup shows the first TRAVERSAL_PREVIEW values and a count.
+        """
+        preview = []
+        count = 0
+        chunk = list(islice(values, TRAVERSAL_LINE))
+        while True:
+            following = list(islice(values, TRAVERSAL_LINE)) if chunk else []
+            line = ("  " if count else f"{name}: [") + " , ".join(map(str, chunk))
+            if len(preview) < TRAVERSAL_PREVIEW:
+                preview.extend(chunk[:TRAVERSAL_PREVIEW - len(preview)])
+            count += len(chunk)
+            if not following:
+                self.write_log(line + ("]" if count <= TRAVERSAL_LINE else f"] ({count} values)"))
+                break
+            self.write_log(line)
+            chunk = following
+
+        res = " , ".join(map(str, preview))
+        if count > len(preview):
+            res += f" , ... ({count} values)"
+        messagebox.showinfo(f"{name} Traversal", res)
 
 if __name__ == "__main__":
     from tkinter import simpledialog
@@ -293,7 +781,7 @@ if __name__ == "__main__":
     
     try:
         lvls = simpledialog.askinteger("Setup", "Input desired level of Binary tree:", 
-                                      minvalue=1, maxvalue=5, parent=temp_root)
+                                      minvalue=1, maxvalue=MAX_LEVELS, parent=temp_root)
         if lvls is None:
             temp_root.destroy()
             exit()
@@ -307,9 +795,13 @@ if __name__ == "__main__":
         if max_v is None:
             temp_root.destroy()
             exit()
+
+        lazy = lvls > NODE_LEVELS and messagebox.askyesno(
+            "Setup", "Create slots lazily, only as values are entered?\n(No = one compact array of every slot)",
+            parent=temp_root)
             
         temp_root.destroy()
-        TreeApp(lvls, min_v, max_v)
+        TreeApp(lvls, min_v, max_v, lazy)
     except Exception as e:
         temp_root.destroy()
         print(f"Error: {e}")
@@ -1,5 +1,11 @@
+import re
+from bisect import bisect_left, insort
+from itertools import islice
 import tkinter as tk
-from tkinter import messagebox, simpledialog, scrolledtext
+from tkinter import filedialog, messagebox, simpledialog, scrolledtext
+import bst_persistent
+import tree_io
+from log_sink import LogSink
 
 FONT_MAIN = ("Segoe UI", 10)
 FONT_TITLE = ("Segoe UI", 11, "bold")
@@ -9,12 +15,112 @@ BG_MAIN = "#F5F7FB"
 PANEL_BG = "#FFFFFF"
 TEXT_BG = "#ECEFF4"
 
+# Layout grid in world units: x = in-order rank * H_GAP, y = depth * V_GAP
+H_GAP = 50
+V_GAP = 80
+NODE_R = 20
+MIN_TEXT_R = 7 # Below this on-screen radius node labels are not drawn
+COLLAPSE_PX = 30 # Subtrees narrower than this on screen become one glyph
+MIN_ZOOM = 0.00001 # Low enough for Fit View to show a million keys
+MAX_ZOOM = 4.0
+SCAN_PAGE = 20 # Keys logged per Range Scan / Next Page click
+
 
 class Node:
+    __slots__ = ("val", "left", "right", "height", "size")
+
     def __init__(self, val):
         self.val = val
         self.left = None
         self.right = None
+        self.height = 1 # Only kept up to date in AVL mode
+        self.size = 1 # Nodes in this subtree, kept up to date in every mode
+
+def height(node):
+    return node.height if node else 0
+
+def size(node):
+    return node.size if node else 0
+
+def range_scan(node, lo=None, hi=None, after=None):
+    """Yields the keys in [lo, hi] in order, in O(log n + k) for k keys.
+
+    Subtrees entirely outside the range are never entered. Pass the last key
+    a previous scan returned as `after` to resume right behind it. Needs no
+    Tk window, so it works on a bare tree of Nodes.
+    """
+    stack = []
+    while True:
+        while node:
+            if (lo is not None and node.val < lo) or (after is not None and node.val <= after):
+                node = node.right # Node and its left subtree are below the range
+            else:
+                stack.append(node)
+                node = node.left
+        if not stack:
+            return
+        node = stack.pop()
+        if hi is not None and node.val > hi:
+            return
+        yield node.val
+        node = node.right
+
+def make_node(val, left=None, right=None):
+    """Node factory for tree_io.load: links the children and sets height and size."""
+    node = Node(val)
+    if left is None and right is None: # Most loaded nodes are leaves; Node() already fits them
+        return node
+    node.left = left
+    node.right = right
+    hl, hr = (left.height if left else 0), (right.height if right else 0)
+    node.height = 1 + (hl if hl > hr else hr)
+    node.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+    return node
+
+def build_balanced(keys, make=make_node, lo=0, hi=None):
+    """Builds a perfectly balanced tree from sorted, distinct keys in O(n).
+
+    make(key, left, right) builds one node, as for tree_io.load; pass
+    bst_persistent.PNode for a persistent tree.
+    """
+    if hi is None:
+        hi = len(keys)
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    return make(keys[mid], build_balanced(keys, make, lo, mid), build_balanced(keys, make, mid + 1, hi))
+
+def copy_tree(node, make=make_node):
+    """Copies the tree under node bottom-up with make(key, left, right),
+    keeping its shape, in O(n) and without recursion."""
+    built = [] # Finished copies, a node's left subtree before its right
+    stack = [(node, False)] if node else []
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            right = built.pop() if node.right else None
+            left = built.pop() if node.left else None
+            built.append(make(node.val, left, right))
+        else:
+            stack.append((node, True))
+            if node.right:
+                stack.append((node.right, False))
+            if node.left:
+                stack.append((node.left, False))
+    return built[0] if built else None
+
+def is_avl(node):
+    """True if every node's subtrees differ in height by at most one."""
+    stack = [node] if node else []
+    while stack:
+        node = stack.pop()
+        if abs(height(node.left) - height(node.right)) > 1:
+            return False
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
+    return True
 
 class TreeUI:
     def __init__(self, root, min_val, max_val):
@@ -24,12 +130,25 @@ class TreeUI:
         self.root.configure(bg=BG_MAIN)
 
         self.tree_root = None
-        self.node_positions = {}
+        self.sorted_keys = [] # In-order view, kept in step with every mutation
+        self.balanced = tk.BooleanVar(value=False)
+        self.rotations = 0
+        self.persistent = tk.BooleanVar(value=False)
+        self.history = None # bst_persistent.History while snapshots are on
 
         # Store the passed values
         self.min_val = min_val
         self.max_val = max_val
 
+        # View transform: screen = world * zoom + pan
+        self.zoom = 1.0
+        self.pan_x = 0
+        self.pan_y = 40
+        self._center_pending = True
+        self._draw_pending = False
+        self._drag_from = None
+        self.scan_cursor = None # (lo, hi, last key shown) of the current Range Scan
+
         self.build_ui()
         self.write_log(f"System Initialized. Range: [{min_val} - {max_val}]")
 
@@ -38,13 +157,36 @@ class TreeUI:
         control_frame = tk.Frame(self.root, bg=PANEL_BG, bd=0)
         control_frame.pack(fill="x", padx=10, pady=10)
 
-        # Left Side: Buttons
-        btn_frame = tk.Frame(control_frame, bg=PANEL_BG)
-        btn_frame.pack(side="left", padx=10, pady=5)
+        # Left Side: Buttons, with the order-statistic queries below them
+        left_frame = tk.Frame(control_frame, bg=PANEL_BG)
+        left_frame.pack(side="left", padx=10, pady=5)
+        btn_frame = tk.Frame(left_frame, bg=PANEL_BG)
+        btn_frame.pack(anchor="w")
+        query_frame = tk.Frame(left_frame, bg=PANEL_BG)
+        query_frame.pack(anchor="w", pady=(8, 0))
+        history_frame = tk.Frame(left_frame, bg=PANEL_BG)
+        history_frame.pack(anchor="w", pady=(8, 0))
 
         self.add_button(btn_frame, "Insert Node", self.insert_node)
         self.add_button(btn_frame, "Delete Node", self.delete_node)
+        self.add_button(btn_frame, "Load File", self.load_file)
+        self.add_button(btn_frame, "Save Tree", self.save_tree)
         self.add_button(btn_frame, "Reset Tree", self.reset_tree)
+        self.add_button(btn_frame, "Fit View", self.fit_view)
+        tk.Checkbutton(btn_frame, text="AVL Balance", variable=self.balanced, command=self.toggle_balance,
+                       bg=PANEL_BG, font=FONT_MAIN, cursor="hand2").pack(side="left", padx=4)
+
+        self.add_button(query_frame, "Rank", self.rank_prompt)
+        self.add_button(query_frame, "K-th Smallest", self.select_prompt)
+        self.add_button(query_frame, "Count Range", self.count_range_prompt)
+        self.add_button(query_frame, "Range Scan", self.range_scan_prompt)
+        self.add_button(query_frame, "Next Page", self.next_scan_page)
+
+        self.add_button(history_frame, "Undo", self.undo)
+        self.add_button(history_frame, "Redo", self.redo)
+        tk.Checkbutton(history_frame, text="Snapshots (undo/redo)", variable=self.persistent,
+                       command=self.toggle_persistent, bg=PANEL_BG, font=FONT_MAIN,
+                       cursor="hand2").pack(side="left", padx=4)
 
         # Right Side: Outputs (Traversals + Logs)
         output_frame = tk.Frame(control_frame, bg=PANEL_BG)
@@ -60,11 +202,20 @@ class TreeUI:
         self.log_text = scrolledtext.ScrolledText(output_frame, width=50, height=5, font=("Consolas", 9), bg=TEXT_BG, bd=0)
         self.log_text.pack()
         self.log_text.configure(state='disabled') # Read-only by default
+        self.log_sink = LogSink(self.log_text, prefix="> ")
 
         # Canvas for Drawing
         self.canvas = tk.Canvas(self.root, bg="white", highlightthickness=0)
         self.canvas.pack(expand=True, fill="both", padx=10, pady=10)
 
+        # Drag to pan, wheel to zoom (Button-4/5 are the X11 wheel events)
+        self.canvas.bind("<ButtonPress-1>", self.start_pan)
+        self.canvas.bind("<B1-Motion>", self.pan)
+        self.canvas.bind("<MouseWheel>", lambda e: self.zoom_at(e.x, e.y, 1.2 if e.delta > 0 else 1 / 1.2))
+        self.canvas.bind("<Button-4>", lambda e: self.zoom_at(e.x, e.y, 1.2))
+        self.canvas.bind("<Button-5>", lambda e: self.zoom_at(e.x, e.y, 1 / 1.2))
+        self.canvas.bind("<Configure>", lambda e: self.request_draw())
+
     # BUTTON FACTORY (hover effect)
     def add_button(self, frame, text, command):
         btn = tk.Label(frame, text=text, bg=BTN_COLOR, fg="white", padx=12, pady=6, font=FONT_MAIN, cursor="hand2")
@@ -75,12 +226,8 @@ class TreeUI:
     
     # --- LOGGING HELPER ---
     def write_log(self, message):
-        """Appends a message to the scrolled text widget."""
-        self.log_text.configure(state='normal')  # Enable editing
-        self.log_text.insert(tk.END, f"> {message}\n")  # Append text
-        self.log_text.see(tk.END)  # Auto-scroll to bottom
-        self.log_text.configure(state='disabled')  # Disable editing
-        print(message)  # Backup print to terminal
+        """Queues a message for the scrolled text widget (and the terminal)."""
+        self.log_sink.write(message)
 
     # BST OPERATIONS
     def insert_node(self):
@@ -95,33 +242,249 @@ class TreeUI:
                                    f"Value must be between {self.min_val} and {self.max_val}.")
             return
 
-        if self.tree_root is None:
-            self.tree_root = Node(val)
+        was_empty = self.tree_root is None
+        self.rotations = 0
+        if not self.insert_value(val):
+            self.write_log(f"⚠️ Ignored duplicate: {val}")
+            messagebox.showwarning("Duplicate", "Value already exists")
+            return
+        if was_empty:
             self.write_log(f"✅ Root initialized with {val}")
         else:
-            if not self.bst_insert(self.tree_root, val):
-                self.write_log(f"⚠️ Ignored duplicate: {val}")
-                messagebox.showwarning("Duplicate", "Value already exists")
-                return
             self.write_log(f"✅ Inserted node: {val}")
+            self.log_rotations()
 
+        insort(self.sorted_keys, val)
         self.redraw()
 
-    def bst_insert(self, root, val):
-        if val == root.val:
+    def insert_value(self, val):
+        """Inserts into the tree using the current mode. False on duplicates."""
+        if self.persistent.get():
+            root, rotations = bst_persistent.insert(self.tree_root, val, self.balanced.get())
+            self.rotations += rotations
+            if root is self.tree_root:
+                return False
+            self.tree_root = root
+            self.history.push(root, ("insert", val))
+            return True
+        if self.tree_root is None:
+            self.tree_root = Node(val)
+            return True
+        if not self.balanced.get():
+            return self.bst_insert(self.tree_root, val)
+        if self.search(self.tree_root, val):
             return False
-        elif val < root.val:
-            if root.left:
-                return self.bst_insert(root.left, val)
+        self.tree_root = self.avl_insert(self.tree_root, val)
+        return True
+
+    def search(self, node, val):
+        while node and node.val != val:
+            node = node.left if val < node.val else node.right
+        return node
+
+    def bst_insert(self, root, val):
+        path = []
+        while True:
+            if val == root.val:
+                return False
+            path.append(root)
+            if val < root.val:
+                if not root.left:
+                    root.left = Node(val)
+                    break
+                root = root.left
             else:
-                root.left = Node(val)
-                return True
+                if not root.right:
+                    root.right = Node(val)
+                    break
+                root = root.right
+        for node in path:
+            node.size += 1
+        return True
+
+    def avl_insert(self, node, val):
+        """Inserts a value known to be absent and returns the new tree root."""
+        if not node:
+            return Node(val)
+        path = []
+        while node:
+            path.append(node)
+            node = node.left if val < node.val else node.right
+        parent = path[-1]
+        if val < parent.val:
+            parent.left = Node(val)
         else:
-            if root.right:
-                return self.bst_insert(root.right, val)
+            parent.right = Node(val)
+        return self.rebalance_path(path)
+
+    def load_file(self):
+        path = filedialog.askopenfilename(title="Load values",
+                                          filetypes=[("Text files", "*.txt *.csv"),
+                                                     ("Saved trees", "*" + tree_io.TREE_EXT),
+                                                     ("All files", "*.*")])
+        if not path:
+            return
+        if path.endswith(tree_io.TREE_EXT):
+            self.open_tree(path)
+            return
+        with open(path, encoding="utf-8") as f:
+            values = [int(v) for v in re.findall(r"-?\d+", f.read())]
+        self.bulk_load(values)
+
+    def bulk_load(self, values):
+        """Merges an iterable of values into the tree and rebuilds it balanced.
+
+        The values are range-checked, deduped and sorted, then the tree is
+        built in O(n) from the sorted sequence and redrawn once.
+        """
+        lo, hi = self.min_val, self.max_val
+        keys = set()
+        rejected = 0
+        for val in values:
+            if lo <= val <= hi:
+                keys.add(val)
+            else:
+                rejected += 1
+        before = len(self.sorted_keys)
+        keys.update(self.sorted_keys)
+        keys = sorted(keys)
+
+        self.tree_root = self.build_tree(keys)
+        self.sorted_keys = keys
+        if self.history:
+            self.history.push(self.tree_root)
+        self.write_log(f"📥 Bulk loaded {len(keys) - before} new value(s), {len(keys)} total")
+        if rejected:
+            self.write_log(f"❌ Skipped {rejected} out-of-range value(s)")
+        self.redraw()
+        self.fit_view()
+
+    def save_tree(self):
+        """Saves the tree, shape included, in the compact tree_io format."""
+        path = filedialog.asksaveasfilename(title="Save tree", defaultextension=tree_io.TREE_EXT,
+                                            filetypes=[("Saved trees", "*" + tree_io.TREE_EXT)])
+        if not path:
+            return
+        try:
+            count = tree_io.save(path, self.tree_root)
+        except (OSError, ValueError) as e:
+            self.write_log(f"❌ Could not save {path}: {e}")
+            messagebox.showerror("Save Tree", str(e))
+            return
+        self.write_log(f"💾 Saved {count} node(s) to {path}")
+
+    def open_tree(self, path):
+        """Replaces the tree with one written by save_tree, keeping its shape."""
+        make = bst_persistent.PNode if self.persistent.get() else make_node
+        try:
+            root = tree_io.load(path, make)
+        except (OSError, ValueError) as e:
+            self.write_log(f"❌ Could not open {path}: {e}")
+            messagebox.showerror("Open Tree", str(e))
+            return
+        keys = list(self.in_order(root))
+        # binary_tree.py saves its empty "?" slots as keyless nodes
+        ordered = None not in keys and all(a < b for a, b in zip(keys, keys[1:]))
+        if not ordered or (keys and not self.min_val <= keys[0] <= keys[-1] <= self.max_val):
+            self.write_log(f"❌ {path} is not a search tree within [{self.min_val} - {self.max_val}]")
+            messagebox.showerror("Open Tree", "The file does not hold a valid tree for this range")
+            return
+        if self.balanced.get() and not is_avl(root):
+            root = self.build_tree(keys)
+            self.write_log("⚖️ Saved tree was not AVL balanced, rebuilt it balanced")
+
+        self.tree_root = root
+        self.sorted_keys = keys
+        if self.history:
+            self.history.push(root)
+        self.write_log(f"📂 Opened {len(keys)} node(s) from {path}")
+        self.redraw()
+        self.fit_view()
+
+    # ORDER STATISTICS (subtree sizes make each query O(height))
+    def rank(self, node, val, inclusive=False):
+        """Counts keys smaller than val (or <= val when inclusive)."""
+        count = 0
+        while node:
+            if val < node.val or (val == node.val and not inclusive):
+                node = node.left
+            else:
+                count += 1 + (node.left.size if node.left else 0)
+                node = node.right
+        return count
+
+    def select(self, node, k):
+        """Returns the k-th smallest key (1-based), or None if out of range."""
+        if not 1 <= k <= size(node):
+            return None
+        while node:
+            left = node.left.size if node.left else 0
+            if k <= left:
+                node = node.left
+            elif k == left + 1:
+                return node.val
             else:
-                root.right = Node(val)
-                return True
+                k -= left + 1
+                node = node.right
+
+    def count_range(self, node, lo, hi):
+        """Counts keys in [lo, hi]."""
+        if lo > hi:
+            return 0
+        return self.rank(node, hi, inclusive=True) - self.rank(node, lo)
+
+    def rank_prompt(self):
+        val = simpledialog.askinteger("Rank", "Value:")
+        if val is not None:
+            self.write_log(f"📊 Rank of {val}: {self.rank(self.tree_root, val)} key(s) are smaller")
+
+    def select_prompt(self):
+        k = simpledialog.askinteger("K-th Smallest", f"k (1 to {size(self.tree_root)}):")
+        if k is None:
+            return
+        val = self.select(self.tree_root, k)
+        if val is None:
+            self.write_log(f"⚠️ No {k}-th key: tree has {size(self.tree_root)} key(s)")
+        else:
+            self.write_log(f"📊 {k}-th smallest key: {val}")
+
+    def count_range_prompt(self):
+        lo = simpledialog.askinteger("Count Range", "From (inclusive):")
+        if lo is None:
+            return
+        hi = simpledialog.askinteger("Count Range", "To (inclusive):")
+        if hi is None:
+            return
+        self.write_log(f"📊 Keys in [{lo}, {hi}]: {self.count_range(self.tree_root, lo, hi)}")
+
+    # RANGE SCAN
+    def range_scan(self, lo=None, hi=None, after=None):
+        """range_scan over this tree, limited to [min_val, max_val] by default."""
+        lo = self.min_val if lo is None else lo
+        hi = self.max_val if hi is None else hi
+        return range_scan(self.tree_root, lo, hi, after)
+
+    def range_scan_prompt(self):
+        lo = simpledialog.askinteger("Range Scan", "From (inclusive):", initialvalue=self.min_val)
+        if lo is None:
+            return
+        hi = simpledialog.askinteger("Range Scan", "To (inclusive):", initialvalue=self.max_val)
+        if hi is None:
+            return
+        self.scan_cursor = (lo, hi, None)
+        self.next_scan_page()
+
+    def next_scan_page(self):
+        if not self.scan_cursor:
+            self.write_log("⚠️ Start a Range Scan first")
+            return
+        lo, hi, after = self.scan_cursor
+        # Ask for one extra key to learn whether another page exists
+        page = list(islice(self.range_scan(lo, hi, after), SCAN_PAGE + 1))
+        more = len(page) > SCAN_PAGE
+        page = page[:SCAN_PAGE]
+        self.write_log(f"🔎 [{lo}, {hi}]: {page}{' …' if more else ''}")
+        self.scan_cursor = (lo, hi, page[-1]) if more else None
 
     def delete_node(self):
         if not self.tree_root:
@@ -134,28 +497,176 @@ class TreeUI:
 
         # We can optionally check if value exists before deleting to log better messages
         # But for now, we just run the delete logic
-        self.tree_root = self.delete_bst(self.tree_root, val)
+        self.rotations = 0
+        if self.persistent.get():
+            root, rotations = bst_persistent.delete(self.tree_root, val, self.balanced.get())
+            self.rotations += rotations
+            if root is not self.tree_root:
+                self.history.push(root, ("delete", val))
+            self.tree_root = root
+        else:
+            self.tree_root = self.delete_bst(self.tree_root, val)
+        self.discard_key(val)
         self.write_log(f"🗑️ Deleted node attempt: {val}")
+        self.log_rotations()
         self.redraw()
 
     def delete_bst(self, root, val):
-        if not root:
+        path = []
+        node = root
+        while node and node.val != val:
+            path.append(node)
+            node = node.left if val < node.val else node.right
+        if not node:
             return root
-        if val < root.val:
-            root.left = self.delete_bst(root.left, val)
-        elif val > root.val:
-            root.right = self.delete_bst(root.right, val)
+
+        if node.left and node.right:
+            # Copy the in-order successor up, then unlink the successor instead
+            path.append(node)
+            succ = node.right
+            while succ.left:
+                path.append(succ)
+                succ = succ.left
+            node.val = succ.val
+            node = succ
+
+        child = node.left or node.right
+        if not path:
+            return child
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
         else:
-            # Node found
-            if not root.left:
-                return root.right
-            if not root.right:
-                return root.left
-            temp = self.find_min(root.right)
-            root.val = temp.val
-            root.right = self.delete_bst(root.right, temp.val)
+            parent.right = child
+
+        if self.balanced.get():
+            return self.rebalance_path(path)
+        for node in path:
+            node.size -= 1
         return root
 
+    # AVL BALANCING
+    def rebalance(self, node):
+        """Restores the AVL property at node after one of its subtrees changed."""
+        left, right = node.left, node.right
+        hl = left.height if left else 0
+        hr = right.height if right else 0
+        if hl - hr > 1:
+            if height(left.left) < height(left.right):
+                node.left = self.rotate_left(left)
+            return self.rotate_right(node)
+        if hr - hl > 1:
+            if height(right.right) < height(right.left):
+                node.right = self.rotate_right(right)
+            return self.rotate_left(node)
+        node.height = 1 + (hl if hl > hr else hr)
+        node.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+        return node
+
+    def rebalance_path(self, path):
+        """Rebalances a root-to-leaf path bottom-up and returns the new tree root."""
+        for i in range(len(path) - 1, 0, -1):
+            node = path[i]
+            sub = self.rebalance(node)
+            if sub is not node:
+                parent = path[i - 1]
+                if parent.left is node:
+                    parent.left = sub
+                else:
+                    parent.right = sub
+        return self.rebalance(path[0])
+
+    def rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        node.height = 1 + max(height(node.left), height(node.right))
+        pivot.height = 1 + max(height(pivot.left), height(pivot.right))
+        node.size = 1 + size(node.left) + size(node.right)
+        pivot.size = 1 + size(pivot.left) + size(pivot.right)
+        self.rotations += 1
+        return pivot
+
+    def rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        node.height = 1 + max(height(node.left), height(node.right))
+        pivot.height = 1 + max(height(pivot.left), height(pivot.right))
+        node.size = 1 + size(node.left) + size(node.right)
+        pivot.size = 1 + size(pivot.left) + size(pivot.right)
+        self.rotations += 1
+        return pivot
+
+    def log_rotations(self):
+        if self.rotations:
+            self.write_log(f"⚖️ Rebalanced with {self.rotations} rotation(s)")
+
+    def toggle_balance(self):
+        if not self.balanced.get():
+            self.write_log("⚖️ AVL balancing OFF")
+            return
+        # Heights are not tracked in plain mode, so rebuild the tree balanced
+        self.tree_root = self.build_tree(self.sorted_keys)
+        if self.history:
+            self.history.push(self.tree_root)
+        self.write_log(f"⚖️ AVL balancing ON (rebuilt {len(self.sorted_keys)} nodes)")
+        self.redraw()
+
+    def build_tree(self, keys):
+        """Builds a balanced tree of the current node kind from sorted keys."""
+        return build_balanced(keys, bst_persistent.PNode if self.persistent.get() else make_node)
+
+    def discard_key(self, val):
+        keys = self.sorted_keys
+        i = bisect_left(keys, val)
+        if i < len(keys) and keys[i] == val:
+            del keys[i]
+
+    # SNAPSHOTS (persistent tree versions)
+    def toggle_persistent(self):
+        # Switching node kinds copies every node but keeps the tree's shape
+        make = bst_persistent.PNode if self.persistent.get() else make_node
+        self.tree_root = copy_tree(self.tree_root, make)
+        if self.persistent.get():
+            self.history = bst_persistent.History(self.tree_root)
+            self.write_log("📸 Snapshots ON: every edit is a version you can undo")
+        else:
+            self.history = None
+            self.write_log("📸 Snapshots OFF: undo history dropped")
+        self.redraw()
+
+    def undo(self):
+        if not self.history or not self.history.can_undo():
+            self.write_log("⚠️ Nothing to undo" if self.history else "⚠️ Turn on Snapshots to use undo")
+            return
+        change = self.history.undo()
+        self.show_version(change, undone=True)
+
+    def redo(self):
+        if not self.history or not self.history.can_redo():
+            self.write_log("⚠️ Nothing to redo" if self.history else "⚠️ Turn on Snapshots to use redo")
+            return
+        change = self.history.redo()
+        self.show_version(change, undone=False)
+
+    def show_version(self, change, undone):
+        """Switches to the history's current root and syncs sorted_keys with it."""
+        self.tree_root = self.history.current
+        verb = "↩️ Undo" if undone else "↪️ Redo"
+        if change is None:
+            # Bulk load, rebuild or reset: re-read the keys from the tree
+            self.sorted_keys = list(self.in_order(self.tree_root))
+            self.write_log(f"{verb}: restored a version with {size(self.tree_root)} key(s)")
+        else:
+            kind, key = change
+            if (kind == "insert") != undone:
+                insort(self.sorted_keys, key)
+            else:
+                self.discard_key(key)
+            self.write_log(f"{verb}: {kind} {key}")
+        self.redraw()
+
     def find_min(self, root):
         while root.left:
             root = root.left
@@ -163,76 +674,185 @@ class TreeUI:
 
     def reset_tree(self):
         self.tree_root = None
-        self.node_positions.clear()
+        if self.history:
+            self.history.push(None) # Reset is undoable while snapshots are on
+        self.sorted_keys.clear()
+        self.zoom = 1.0
+        self._center_pending = True
         self.canvas.delete("all")
         self.traversal_text.delete("1.0", "end")
         self.write_log("🔄 Tree reset.")
 
     # DRAW OPERATIONS
     def redraw(self):
-        self.canvas.delete("all")
-        self.node_positions.clear()
-
-        if self.tree_root:
-            self.calc_positions(self.tree_root, 500, 40, 200) # Centered slightly better
-            self.draw_tree(self.tree_root)
+        """Repaints the view after a tree change.
 
+        There is no stored layout to update: draw_tree derives each visible
+        node's position from the subtree sizes on its way down.
+        """
+        self.request_draw()
         self.show_traversals()
 
-    def calc_positions(self, node, x, y, offset):
-        if not node:
+    def request_draw(self):
+        """Schedules one repaint; a burst of changes is coalesced into it."""
+        if not self._draw_pending:
+            self._draw_pending = True
+            self.root.after_idle(self.draw_tree)
+
+    def draw_tree(self):
+        """Paints only the nodes inside the viewport.
+
+        The layout is a grid: x from the in-order rank, y from the depth, so no
+        two nodes can overlap at any zoom. A subtree whose ranks start at
+        `start` owns ranks [start, start + size - 1], which gives every node's
+        position and its subtree's x span from the sizes alone. Subtrees
+        wholly outside the view are skipped without visiting their nodes, and
+        subtrees too narrow to read are drawn as one summary glyph, so a
+        repaint costs O(visible nodes + height).
+        """
+        self._draw_pending = False
+        canvas = self.canvas
+        canvas.delete("all")
+        if not self.tree_root:
             return
-        self.node_positions[node] = (x, y)
-        self.calc_positions(node.left, x - offset, y + 80, offset // 2)
-        self.calc_positions(node.right, x + offset, y + 80, offset // 2)
 
-    def draw_tree(self, node):
-        if node.left:
-            x1, y1 = self.node_positions[node]
-            x2, y2 = self.node_positions[node.left]
-            self.canvas.create_line(x1, y1, x2, y2)
-            self.draw_tree(node.left)
-
-        if node.right:
-            x1, y1 = self.node_positions[node]
-            x2, y2 = self.node_positions[node.right]
-            self.canvas.create_line(x1, y1, x2, y2)
-            self.draw_tree(node.right)
-
-        x, y = self.node_positions[node]
-        r = 20
-        self.canvas.create_oval(x-r, y-r, x+r, y+r, fill="#4C89FF", outline="#204A99")
-        self.canvas.create_text(x, y, text=str(node.val), fill="white", font=("Segoe UI", 10, "bold"))
+        w = canvas.winfo_width() if canvas.winfo_width() > 1 else 980
+        h = canvas.winfo_height() if canvas.winfo_height() > 1 else 500
+        if self._center_pending:
+            self._center_pending = False
+            self.pan_x = w / 2 - size(self.tree_root.left) * H_GAP * self.zoom
+
+        z, px, py = self.zoom, self.pan_x, self.pan_y
+        r = NODE_R * z
+        font = ("Segoe UI", max(6, round(10 * z)), "bold")
+        # Visible world rectangle, padded by one node radius
+        x0 = -px / z - NODE_R
+        x1 = (w - px) / z + NODE_R
+        y0 = -py / z - NODE_R
+        y1 = (h - py) / z + NODE_R
+
+        stack = [(self.tree_root, 0, 0)] # (node, first in-order rank of its subtree, depth)
+        while stack:
+            node, start, depth = stack.pop()
+            count = node.size
+            lo, hi = start * H_GAP, (start + count - 1) * H_GAP
+            y = depth * V_GAP
+            if hi < x0 or lo > x1 or y > y1:
+                continue
+            rank = start + size(node.left)
+            sx, sy = rank * H_GAP * z + px, y * z + py
+
+            if count > 1 and (hi - lo + 2 * NODE_R) * z < COLLAPSE_PX:
+                base = sy + V_GAP * z
+                canvas.create_polygon(sx, sy - r, lo * z + px - r, base, hi * z + px + r, base,
+                                      fill="#9DB8F2", outline="#204A99", tags="node")
+                if r >= MIN_TEXT_R:
+                    canvas.create_text(sx, (sy + base) / 2, text=str(count), font=font, tags="node")
+                continue
+
+            cy = sy + V_GAP * z
+            left, right = node.left, node.right
+            if left:
+                canvas.create_line(sx, sy, (start + size(left.left)) * H_GAP * z + px, cy)
+                stack.append((left, start, depth + 1))
+            if right:
+                canvas.create_line(sx, sy, (rank + 1 + size(right.left)) * H_GAP * z + px, cy)
+                stack.append((right, rank + 1, depth + 1))
+            if y >= y0:
+                canvas.create_oval(sx-r, sy-r, sx+r, sy+r, fill="#4C89FF", outline="#204A99", tags="node")
+                if r >= MIN_TEXT_R:
+                    canvas.create_text(sx, sy, text=str(node.val), fill="white", font=font, tags="node")
+
+        # Edges were drawn interleaved with nodes; keep every node on top
+        canvas.tag_raise("node")
+
+    def fit_view(self):
+        """Zooms out (never in past 1:1) so the whole tree width is visible."""
+        if not self.tree_root:
+            return
+        w = self.canvas.winfo_width() if self.canvas.winfo_width() > 1 else 980
+        width = (self.tree_root.size - 1) * H_GAP # The root's subtree spans ranks 0..size-1
+        self.zoom = max(MIN_ZOOM, min(1.0, (w - 40) / (width + 2 * NODE_R)))
+        self.pan_x = 20 + NODE_R * self.zoom
+        self.pan_y = 40
+        self._center_pending = False
+        self.request_draw()
+
+    def start_pan(self, event):
+        self._drag_from = (event.x, event.y)
+
+    def pan(self, event):
+        if self._drag_from:
+            self.pan_x += event.x - self._drag_from[0]
+            self.pan_y += event.y - self._drag_from[1]
+            self._drag_from = (event.x, event.y)
+            self.request_draw()
+
+    def zoom_at(self, x, y, factor):
+        """Zooms by factor, keeping the world point under (x, y) fixed."""
+        zoom = min(MAX_ZOOM, max(MIN_ZOOM, self.zoom * factor))
+        factor = zoom / self.zoom
+        self.pan_x = x - (x - self.pan_x) * factor
+        self.pan_y = y - (y - self.pan_y) * factor
+        self.zoom = zoom
+        self.request_draw()
 
     # TRAVERSAL LOGIC
     def show_traversals(self):
-        inorder, preorder, postorder = [], [], []
-        self.in_order(self.tree_root, inorder)
-        self.pre_order(self.tree_root, preorder)
-        self.post_order(self.tree_root, postorder)
-
+        # In-order comes from the maintained sorted view. Pre/post-order are
+        # walked lazily and only as far as fits on one line of the box.
+        width = int(self.traversal_text.cget("width"))
         self.traversal_text.delete("1.0", "end")
-        self.traversal_text.insert("end", f"In-Order  (LNR): {inorder}\n")
-        self.traversal_text.insert("end", f"Pre-Order (NLR): {preorder}\n")
-        self.traversal_text.insert("end", f"Post-Order(LRN): {postorder}\n")
-
-    def in_order(self, node, arr):
-        if node:
-            self.in_order(node.left, arr)
-            arr.append(node.val)
-            self.in_order(node.right, arr)
-
-    def pre_order(self, node, arr):
-        if node:
-            arr.append(node.val)
-            self.pre_order(node.left, arr)
-            self.pre_order(node.right, arr)
-
-    def post_order(self, node, arr):
-        if node:
-            self.post_order(node.left, arr)
-            self.post_order(node.right, arr)
-            arr.append(node.val)
+        self.traversal_text.insert("end", self.format_traversal("In-Order  (LNR): ", self.sorted_keys, width))
+        self.traversal_text.insert("end", self.format_traversal("Pre-Order (NLR): ", self.pre_order(self.tree_root), width))
+        self.traversal_text.insert("end", self.format_traversal("Post-Order(LRN): ", self.post_order(self.tree_root), width))
+
+    def format_traversal(self, label, values, width):
+        """Formats as many values as fit in width characters, then an ellipsis."""
+        text = label + "["
+        for val in values:
+            item = f"{val}, "
+            if len(text) + len(item) > width - 2: # Leave room for "…]"
+                return text + "…]\n"
+            text += item
+        return text.rstrip(", ") + "]\n"
+
+    def in_order(self, node):
+        stack = []
+        while True:
+            while node:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            yield node.val
+            node = node.right
+
+    def pre_order(self, node):
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            yield node.val
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def post_order(self, node):
+        stack = []
+        last = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+                continue
+            top = stack[-1]
+            if top.right and last is not top.right:
+                node = top.right
+            else:
+                yield top.val
+                last = stack.pop()
 
 # START APP - Get input FIRST, then create main window
 if __name__ == "__main__":
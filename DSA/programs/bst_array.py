@@ -0,0 +1,207 @@
+"""Compact array-backed binary search tree.
+
+An alternative store to bst.Node for very large trees. Keys, child links and
+layout coordinates live in parallel `array` module arrays indexed by node
+slot, so a node costs about 40 bytes instead of the roughly 100 of a slotted
+bst.Node object. Deleted slots are chained through the `left` array into a
+free list and reused by later inserts.
+"""
+from array import array
+
+NIL = -1
+
+
+class ArrayBST:
+    def __init__(self):
+        self.keys = array('q')
+        self.left = array('q')
+        self.right = array('q')
+        self.x = array('d')
+        self.y = array('d')
+        self.root = NIL
+        self.free = NIL  # Head of the free-slot list, linked through `left`
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self.find(key) != NIL
+
+    @classmethod
+    def from_sorted(cls, keys):
+        """Builds a perfectly balanced tree from sorted, distinct keys in O(n)."""
+        tree = cls()
+        n = len(keys)
+        tree.keys = array('q', keys)
+        tree.left = array('q', [NIL]) * n
+        tree.right = array('q', [NIL]) * n
+        tree.x = array('d', [0.0]) * n
+        tree.y = array('d', [0.0]) * n
+        tree.size = n
+        if not n:
+            return tree
+        # Slot i holds keys[i]; link each range's middle to its halves' middles
+        left, right = tree.left, tree.right
+        tree.root = (n - 1) // 2
+        stack = [(0, n)]
+        while stack:
+            lo, hi = stack.pop()
+            mid = (lo + hi - 1) // 2
+            if lo < mid:
+                left[mid] = (lo + mid - 1) // 2
+                stack.append((lo, mid))
+            if mid + 1 < hi:
+                right[mid] = (mid + hi) // 2
+                stack.append((mid + 1, hi))
+        return tree
+
+    def _alloc(self, key):
+        slot = self.free
+        if slot == NIL:
+            self.keys.append(key)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.x.append(0.0)
+            self.y.append(0.0)
+            return len(self.keys) - 1
+        self.free = self.left[slot]
+        self.keys[slot] = key
+        self.left[slot] = NIL
+        self.right[slot] = NIL
+        return slot
+
+    def _release(self, slot):
+        self.left[slot] = self.free
+        self.right[slot] = NIL
+        self.free = slot
+
+    def find(self, key):
+        """Returns the slot holding key, or NIL."""
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while node != NIL:
+            k = keys[node]
+            if key == k:
+                return node
+            node = left[node] if key < k else right[node]
+        return NIL
+
+    def insert(self, key):
+        """Inserts key. Returns False if it is already present."""
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        if node == NIL:
+            self.root = self._alloc(key)
+            self.size += 1
+            return True
+        while True:
+            k = keys[node]
+            if key == k:
+                return False
+            if key < k:
+                if left[node] == NIL:
+                    left[node] = self._alloc(key)
+                    break
+                node = left[node]
+            else:
+                if right[node] == NIL:
+                    right[node] = self._alloc(key)
+                    break
+                node = right[node]
+        self.size += 1
+        return True
+
+    def delete(self, key):
+        """Deletes key. Returns False if it was not present."""
+        keys, left, right = self.keys, self.left, self.right
+        parent = NIL
+        node = self.root
+        while node != NIL and keys[node] != key:
+            parent = node
+            node = left[node] if key < keys[node] else right[node]
+        if node == NIL:
+            return False
+
+        if left[node] != NIL and right[node] != NIL:
+            # Copy the in-order successor up, then unlink the successor instead
+            parent = node
+            succ = right[node]
+            while left[succ] != NIL:
+                parent = succ
+                succ = left[succ]
+            keys[node] = keys[succ]
+            node = succ
+
+        child = left[node] if left[node] != NIL else right[node]
+        if parent == NIL:
+            self.root = child
+        elif left[parent] == node:
+            left[parent] = child
+        else:
+            right[parent] = child
+        self._release(node)
+        self.size -= 1
+        return True
+
+    # TRAVERSALS
+    def in_order(self):
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        node = self.root
+        while True:
+            while node != NIL:
+                stack.append(node)
+                node = left[node]
+            if not stack:
+                return
+            node = stack.pop()
+            yield keys[node]
+            node = right[node]
+
+    def pre_order(self):
+        keys, left, right = self.keys, self.left, self.right
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            node = stack.pop()
+            yield keys[node]
+            if right[node] != NIL:
+                stack.append(right[node])
+            if left[node] != NIL:
+                stack.append(left[node])
+
+    def post_order(self):
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        node = self.root
+        last = NIL
+        while stack or node != NIL:
+            if node != NIL:
+                stack.append(node)
+                node = left[node]
+                continue
+            top = stack[-1]
+            if right[top] != NIL and last != right[top]:
+                node = right[top]
+            else:
+                yield keys[top]
+                last = stack.pop()
+
+    # LAYOUT
+    def layout(self, h_gap=50, v_gap=80):
+        """Fills the x/y arrays on TreeUI's grid: x from the in-order rank, y
+        from the depth."""
+        xs, ys, left, right = self.x, self.y, self.left, self.right
+        stack = []
+        node, depth, rank = self.root, 0, 0
+        while True:
+            while node != NIL:
+                stack.append((node, depth))
+                node, depth = left[node], depth + 1
+            if not stack:
+                return
+            node, depth = stack.pop()
+            xs[node] = rank * h_gap
+            ys[node] = depth * v_gap
+            rank += 1
+            node, depth = right[node], depth + 1
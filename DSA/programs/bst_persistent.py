@@ -0,0 +1,162 @@
+"""Persistent (path-copying) binary search tree.
+
+insert and delete never modify a node. They copy the nodes on the
+root-to-target path and share every other subtree with the previous version,
+so each version costs O(height) new nodes (O(log n) when balanced) and old
+roots stay valid forever. That makes undo/redo a matter of keeping roots
+around, and any root can be handed to another thread without locking.
+
+PNode exposes the same val/left/right/height/size attributes as bst.Node, so
+the read-only TreeUI code (drawing, traversals, rank/select, range scans)
+works on either kind of tree.
+"""
+
+
+class PNode:
+    __slots__ = ("val", "left", "right", "height", "size")
+
+    def __init__(self, val, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+        self.height = 1 + max(left.height if left else 0, right.height if right else 0)
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+
+
+def _height(node):
+    return node.height if node else 0
+
+
+def _balanced_node(val, left, right):
+    """Like PNode(val, left, right), rotating (into new nodes) if AVL is violated.
+
+    Returns (node, rotations), counting a double rotation as two like TreeUI does.
+    """
+    hl, hr = _height(left), _height(right)
+    if hl - hr > 1:
+        rotations = 1
+        if _height(left.left) < _height(left.right):
+            lr = left.right
+            left = PNode(lr.val, PNode(left.val, left.left, lr.left), lr.right)
+            rotations += 1
+        return PNode(left.val, left.left, PNode(val, left.right, right)), rotations
+    if hr - hl > 1:
+        rotations = 1
+        if _height(right.right) < _height(right.left):
+            rl = right.left
+            right = PNode(rl.val, rl.left, PNode(right.val, rl.right, right.right))
+            rotations += 1
+        return PNode(right.val, PNode(val, left, right.left), right.right), rotations
+    return PNode(val, left, right), 0
+
+
+def _plain_node(val, left, right):
+    return PNode(val, left, right), 0
+
+
+def _rebuild(path, sub, make):
+    """Copies the (node, went left) path bottom-up on top of sub.
+
+    Returns (new root, rotations).
+    """
+    rotations = 0
+    for node, went_left in reversed(path):
+        if went_left:
+            sub, turns = make(node.val, sub, node.right)
+        else:
+            sub, turns = make(node.val, node.left, sub)
+        rotations += turns
+    return sub, rotations
+
+
+def insert(root, val, balanced=True):
+    """Returns (new root, rotations) with val added.
+
+    The root is root itself (and rotations 0) if val is present.
+    """
+    path = [] # (node, went left)
+    node = root
+    while node:
+        if val == node.val:
+            return root, 0
+        went_left = val < node.val
+        path.append((node, went_left))
+        node = node.left if went_left else node.right
+
+    make = _balanced_node if balanced else _plain_node
+    return _rebuild(path, PNode(val), make)
+
+
+def delete(root, val, balanced=True):
+    """Returns (new root, rotations) without val.
+
+    The root is root itself (and rotations 0) if val is absent.
+    """
+    path = []
+    node = root
+    while node and node.val != val:
+        went_left = val < node.val
+        path.append((node, went_left))
+        node = node.left if went_left else node.right
+    if not node:
+        return root, 0
+
+    make = _balanced_node if balanced else _plain_node
+    rotations = 0
+    if node.left and node.right:
+        # Rebuild the right subtree without its minimum, which replaces node
+        right_path = []
+        succ = node.right
+        while succ.left:
+            right_path.append((succ, True))
+            succ = succ.left
+        sub, rotations = _rebuild(right_path, succ.right, make)
+        sub, turns = make(succ.val, node.left, sub)
+        rotations += turns
+    else:
+        sub = node.left or node.right
+
+    sub, turns = _rebuild(path, sub, make)
+    return sub, rotations + turns
+
+
+class History:
+    """Linear undo/redo over tree versions.
+
+    Each entry is (root, change). change describes how that version was made
+    from the one before: ("insert", key), ("delete", key), or None for
+    wholesale changes such as a bulk load or reset.
+    """
+
+    def __init__(self, root=None, limit=None):
+        self.entries = [(root, None)]
+        self.index = 0
+        self.limit = limit
+
+    @property
+    def current(self):
+        return self.entries[self.index][0]
+
+    def push(self, root, change=None):
+        del self.entries[self.index + 1:] # A new edit drops the redo branch
+        self.entries.append((root, change))
+        if self.limit and len(self.entries) > self.limit:
+            del self.entries[0]
+        self.index = len(self.entries) - 1
+
+    def can_undo(self):
+        return self.index > 0
+
+    def can_redo(self):
+        return self.index < len(self.entries) - 1
+
+    def undo(self):
+        """Steps back one version and returns the change that was undone."""
+        change = self.entries[self.index][1]
+        self.index -= 1
+        return change
+
+    def redo(self):
+        """Steps forward one version and returns the change that was redone."""
+        self.index += 1
+        return self.entries[self.index][1]
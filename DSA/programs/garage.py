@@ -0,0 +1,203 @@
+"""Headless parking garage engines.
+
+This module never imports tkinter, so the garage logic can be used from a
+server or batch job. stack.py and queue.py are thin Tk views over these
+classes.
+"""
+
+GARAGE_CAPACITY = 10
+
+# arrive() results
+PARKED = "parked"
+DUPLICATE = "duplicate"
+FULL = "full"
+
+
+class GarageStack:
+    """LIFO garage with a plate -> slot hash index.
+
+    Slots are kept bottom-first so parking is an append. Iterating yields
+    plates from the TOP (exit) down.
+    """
+    __slots__ = ("capacity", "arrivals", "departures", "log", "_slots", "_index")
+
+    def __init__(self, capacity=GARAGE_CAPACITY, log=None):
+        self.capacity = capacity
+        self.log = log
+        self._slots = []
+        self._index = {}
+        self.arrivals = 0
+        self.departures = 0
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __iter__(self):
+        return reversed(self._slots)
+
+    def __contains__(self, plate):
+        return plate in self._index
+
+    def arrive(self, plate):
+        """Parks a car at the top. Returns PARKED, or DUPLICATE / FULL if refused."""
+        plate = plate.upper()
+        if plate in self._index:
+            if self.log:
+                self.log(f"⚠️ {plate} is already parked.")
+            return DUPLICATE
+        if len(self._slots) >= self.capacity:
+            if self.log:
+                self.log("❌ Garage is full!")
+            return FULL
+        self._index[plate] = len(self._slots)
+        self._slots.append(plate)
+        self.arrivals += 1
+        if self.log:
+            self.log(f"✅ {plate} parked at the TOP.")
+        return PARKED
+
+    def depart(self, plate):
+        """Removes a car from anywhere in the stack.
+
+        Returns the number of moves needed, or None if the car is not here.
+        """
+        plate = plate.upper()
+        pos = self._index.pop(plate, None)
+        if pos is None:
+            if self.log:
+                self.log(f"❓ Error: Car '{plate}' not found.")
+            return None
+
+        slots = self._slots
+        above = len(slots) - 1 - pos
+        del slots[pos]
+        # Only the cars above the gap change slot
+        for i in range(pos, len(slots)):
+            self._index[slots[i]] = i
+
+        # Every car above the target is popped off and restacked,
+        # plus one pop for the target itself.
+        ops = 2 * above + 1
+        self.departures += 1
+        if self.log:
+            self.log(f"🎯 {plate} departed.")
+            self.log(f"📊 Total Moves: {ops}")
+        return ops
+
+    def reset(self):
+        self._slots.clear()
+        self._index.clear()
+        self.arrivals = 0
+        self.departures = 0
+
+
+class GarageQueue:
+    """FIFO garage backed by a fixed-capacity ring buffer.
+
+    `_head` is the slot of the car at the front (exit). Iterating yields
+    plates from the entrance to the exit. Like GarageStack, a plate can only
+    be parked once.
+    """
+    __slots__ = ("capacity", "arrivals", "departures", "log", "_buf", "_head", "_size", "_plates")
+
+    def __init__(self, capacity=GARAGE_CAPACITY, log=None):
+        self.capacity = capacity
+        self.log = log
+        self._buf = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self._plates = set()  # Parked plates, for O(1) misses and duplicate checks
+        self.arrivals = 0
+        self.departures = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        buf, head, cap = self._buf, self._head, self.capacity
+        for k in range(self._size - 1, -1, -1):
+            yield buf[(head + k) % cap]
+
+    def __contains__(self, plate):
+        return plate in self._plates
+
+    def _find(self, plate):
+        """Returns how many cars are ahead of plate, or -1 if absent."""
+        if plate not in self._plates:
+            return -1
+        buf, head, cap = self._buf, self._head, self.capacity
+        end = head + self._size
+        # list.index scans in C; a wrapped buffer is searched in two runs
+        try:
+            return buf.index(plate, head, min(end, cap)) - head
+        except ValueError:
+            if end <= cap:
+                return -1
+        try:
+            return buf.index(plate, 0, end - cap) + cap - head
+        except ValueError:
+            return -1
+
+    def arrive(self, plate):
+        """Adds a car at the back. Returns PARKED, or DUPLICATE / FULL if refused."""
+        plate = plate.upper()
+        if plate in self._plates:
+            if self.log:
+                self.log(f"⚠️ {plate} is already parked.")
+            return DUPLICATE
+        if self._size >= self.capacity:
+            if self.log:
+                self.log("❌ Garage is full!")
+            return FULL
+        self._buf[(self._head + self._size) % self.capacity] = plate
+        self._size += 1
+        self._plates.add(plate)
+        self.arrivals += 1
+        if self.log:
+            self.log(f"✅ {plate} joined the queue.")
+        return PARKED
+
+    def depart(self, plate):
+        """Removes a car from anywhere in the queue.
+
+        Returns the number of moves needed, or None if the car is not here.
+        """
+        plate = plate.upper()
+        ahead = self._find(plate)
+        if ahead < 0:
+            if self.log:
+                self.log(f"❓ Error: Car '{plate}' not found.")
+            return None
+
+        # The cars in front slide back one slot to close the gap, so the
+        # buffer is compacted in a single pass.
+        buf, head, cap = self._buf, self._head, self.capacity
+        pos = head + ahead
+        if pos < cap:
+            buf[head + 1:pos + 1] = buf[head:pos]
+        else:
+            pos -= cap
+            buf[1:pos + 1] = buf[0:pos]
+            buf[0] = buf[cap - 1]
+            buf[head + 1:cap] = buf[head:cap - 1]
+        buf[head] = None
+        self._head = (head + 1) % cap
+        self._size -= 1
+        self._plates.remove(plate)
+
+        # Every car ahead of the target steps out and rejoins the front,
+        # plus one move for the target itself.
+        ops = 2 * ahead + 1
+        self.departures += 1
+        if self.log:
+            self.log(f"🎯 {plate} exited the front.")
+            self.log(f"📊 Total Moves: {ops}")
+        return ops
+
+    def reset(self):
+        self._buf = [None] * self.capacity
+        self._head = 0
+        self._size = 0
+        self._plates.clear()
+        self.arrivals = 0
+        self.departures = 0
@@ -0,0 +1,206 @@
+"""Streaming replay of gate logs through the headless garage engines.
+
+Events are read in chunks from CSV (columns ``op,plate``) or JSONL
+(``{"op": "arrive", "plate": "ABC123"}``) and applied to an in-memory
+GarageStack or GarageQueue without opening any dialogs.
+
+    python garage_replay.py gate_log.csv --mode queue --capacity 5000
+"""
+import argparse
+import csv
+import itertools
+import json
+import operator
+import sys
+import time
+
+from garage import DUPLICATE, GARAGE_CAPACITY, PARKED, GarageQueue, GarageStack
+
+ENGINES = {"stack": GarageStack, "queue": GarageQueue}
+CHUNK_SIZE = 65536
+EVENT_FIELDS = ("op", "plate")
+
+
+class ReplayStats:
+    """Aggregate counters for a replay, with a histogram of moves per departure."""
+    COUNTERS = ("events", "arrivals", "departures", "total_moves",
+                "rejected_full", "duplicates", "not_found", "malformed")
+    __slots__ = COUNTERS + ("moves_hist",)
+
+    def __init__(self):
+        self.events = 0
+        self.arrivals = 0
+        self.departures = 0
+        self.total_moves = 0
+        self.rejected_full = 0
+        self.duplicates = 0
+        self.not_found = 0
+        self.malformed = 0 # Rows with an unknown op or that could not be read
+        self.moves_hist = {}
+
+    def percentile(self, p):
+        """Nearest-rank percentile of moves per departure (0 if none departed)."""
+        if not self.departures:
+            return 0
+        rank = max(1, -(-p * self.departures // 100))
+        seen = 0
+        for moves in sorted(self.moves_hist):
+            seen += self.moves_hist[moves]
+            if seen >= rank:
+                return moves
+        return moves
+
+    def merge(self, other):
+        """Adds another replay's counters into this one."""
+        for name in self.COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        hist = self.moves_hist
+        for moves, count in other.moves_hist.items():
+            hist[moves] = hist.get(moves, 0) + count
+        return self
+
+    def as_dict(self):
+        return {
+            "events": self.events,
+            "arrivals": self.arrivals,
+            "departures": self.departures,
+            "total_moves": self.total_moves,
+            "rejected_full": self.rejected_full,
+            "duplicates": self.duplicates,
+            "not_found": self.not_found,
+            "malformed": self.malformed,
+            "p50_moves": self.percentile(50),
+            "p99_moves": self.percentile(99),
+        }
+
+
+def _chunked(rows, chunk_size):
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _csv_rows(f, fields, on_bad_row):
+    reader = csv.reader(f)
+    header = [name.strip().lower() for name in next(reader, [])]
+    try:
+        cols = [header.index(name) for name in fields]
+    except ValueError:
+        raise ValueError(f"CSV header needs columns {list(fields)}, got {header}") from None
+    getter = operator.itemgetter(*cols)
+    for row in reader:
+        if row:
+            try:
+                yield getter(row)
+            except IndexError:
+                on_bad_row(reader.line_num, f"short row {row!r}")
+
+
+def _jsonl_rows(f, fields, on_bad_row):
+    loads = json.loads
+    getter = operator.itemgetter(*fields)
+    for line_num, line in enumerate(f, 1):
+        if line.strip():
+            try:
+                yield getter(loads(line))
+            except KeyError as e:
+                on_bad_row(line_num, f"missing key {e}")
+            except (TypeError, ValueError):
+                on_bad_row(line_num, "not a JSON object")
+
+
+def ignore_bad_row(line_num, reason):
+    """An on_bad_row for read_events that drops unreadable rows silently."""
+
+
+def read_events(path, chunk_size=CHUNK_SIZE, fields=EVENT_FIELDS, on_bad_row=None):
+    """Yields lists of event tuples, at most chunk_size per list.
+
+    Each tuple holds the given fields, (op, plate) by default. Files
+    ending in .jsonl/.ndjson are read as JSON lines, anything else as CSV
+    with a header row. Rows that cannot be read are skipped and passed to
+    on_bad_row(line number, reason), which by default reports them on stderr.
+    """
+    if on_bad_row is None:
+        def on_bad_row(line_num, reason):
+            print(f"{path}:{line_num}: skipped {reason}", file=sys.stderr)
+
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            rows = _jsonl_rows(f, fields, on_bad_row)
+        else:
+            rows = _csv_rows(f, fields, on_bad_row)
+        yield from _chunked(rows, chunk_size)
+
+
+def replay(chunks, garage, stats=None):
+    """Applies chunks of (op, plate) events to garage and returns the stats.
+
+    Ops are matched like the CSV header, ignoring case and surrounding
+    spaces; events with any other op are counted as malformed.
+    """
+    if stats is None:
+        stats = ReplayStats()
+    arrive, depart = garage.arrive, garage.depart
+    hist = stats.moves_hist
+    for chunk in chunks:
+        stats.events += len(chunk)
+        for op, plate in chunk:
+            if op != "arrive" and op != "depart" and isinstance(op, str):
+                op = op.strip().lower() # Slow path only for unusual spellings
+            if op == "arrive":
+                result = arrive(plate)
+                if result == PARKED:
+                    stats.arrivals += 1
+                elif result == DUPLICATE:
+                    stats.duplicates += 1
+                else:
+                    stats.rejected_full += 1
+            elif op == "depart":
+                moves = depart(plate)
+                if moves is None:
+                    stats.not_found += 1
+                else:
+                    stats.departures += 1
+                    stats.total_moves += moves
+                    hist[moves] = hist.get(moves, 0) + 1
+            else:
+                stats.malformed += 1
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay gate logs through a garage engine.")
+    parser.add_argument("path", help="CSV (op,plate) or JSONL event file")
+    parser.add_argument("--mode", choices=sorted(ENGINES), default="stack")
+    parser.add_argument("--capacity", type=int, default=GARAGE_CAPACITY)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--json", action="store_true", help="print the stats as JSON")
+    args = parser.parse_args(argv)
+
+    garage = ENGINES[args.mode](capacity=args.capacity)
+    stats = ReplayStats()
+
+    def on_bad_row(line_num, reason):
+        stats.malformed += 1
+        print(f"{args.path}:{line_num}: skipped {reason}", file=sys.stderr)
+
+    start = time.perf_counter()
+    replay(read_events(args.path, args.chunk_size, on_bad_row=on_bad_row), garage, stats)
+    elapsed = time.perf_counter() - start
+
+    result = stats.as_dict()
+    if args.json:
+        json.dump(result, sys.stdout)
+        print()
+    else:
+        for key, value in result.items():
+            print(f"{key:>14}: {value}")
+        rate = stats.events / elapsed if elapsed else 0
+        print(f"{'throughput':>14}: {rate:,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Batched, bounded log sink shared by the Tk visualizers.
+
+Messages are buffered in a bounded ring buffer and written to a Text widget
+in one batch per timer tick, instead of toggling the widget state, inserting
+and scrolling on every call. Lines past `max_lines` are trimmed from the top.
+The terminal echo is optional and runs on a background thread.
+"""
+import sys
+import threading
+from collections import deque
+
+LOG_MAX_LINES = 1000
+LOG_FLUSH_MS = 50
+
+
+class _TerminalEcho(threading.Thread):
+    """Prints log messages off the Tk thread."""
+
+    def __init__(self, max_pending=10000):
+        super().__init__(name="log-echo", daemon=True)
+        self._lines = deque(maxlen=max_pending)
+        self._ready = threading.Condition()
+
+    def put(self, message):
+        with self._ready:
+            self._lines.append(message)
+            self._ready.notify()
+
+    def run(self):
+        while True:
+            with self._ready:
+                while not self._lines:
+                    self._ready.wait()
+                batch = list(self._lines)
+                self._lines.clear()
+            sys.stdout.write("".join(message + "\n" for message in batch))
+            sys.stdout.flush()
+
+
+_echo = None
+
+
+def _terminal_echo():
+    global _echo
+    if _echo is None:
+        _echo = _TerminalEcho()
+        _echo.start()
+    return _echo
+
+
+class LogSink:
+    def __init__(self, widget, prefix="", max_lines=LOG_MAX_LINES,
+                 flush_ms=LOG_FLUSH_MS, echo=True):
+        self.widget = widget
+        self.prefix = prefix
+        self.max_lines = max_lines
+        self.flush_ms = flush_ms
+        self.echo = _terminal_echo() if echo else None
+        # Anything older than max_lines would be trimmed anyway
+        self._pending = deque(maxlen=max_lines)
+        self._flush_id = None
+
+    def write(self, message):
+        """Queues a message; the widget is updated on the next flush."""
+        self._pending.append(message)
+        if self.echo:
+            self.echo.put(message)
+        if self._flush_id is None:
+            self._flush_id = self.widget.after(self.flush_ms, self.flush)
+
+    def flush(self):
+        """Writes all pending messages to the widget in one batch."""
+        if self._flush_id is not None:
+            self.widget.after_cancel(self._flush_id)
+            self._flush_id = None
+        if not self._pending:
+            return
+        prefix = self.prefix
+        text = "".join(f"{prefix}{message}\n" for message in self._pending)
+        self._pending.clear()
+
+        widget = self.widget
+        widget.configure(state='normal')
+        widget.insert('end', text)
+        # The Text widget always keeps an empty last line after the final "\n"
+        excess = int(widget.index('end-1c').split('.')[0]) - 1 - self.max_lines
+        if excess > 0:
+            widget.delete('1.0', f'{excess + 1}.0')
+        widget.see('end')
+        widget.configure(state='disabled')
+
+    def clear(self):
+        """Drops pending messages and empties the widget."""
+        if self._flush_id is not None:
+            self.widget.after_cancel(self._flush_id)
+            self._flush_id = None
+        self._pending.clear()
+        self.widget.configure(state='normal')
+        self.widget.delete('1.0', 'end')
+        self.widget.configure(state='disabled')
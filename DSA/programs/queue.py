@@ -1,46 +1,7 @@
 import tkinter as tk
 from tkinter import simpledialog, scrolledtext
-
-# --- GLOBAL DATA ---
-garage_queue = []
-garage_capacity = 10
-total_arrivals = 0
-total_departures = 0
-
-def arrive(queue, plate, current_count, log_func):
-    plate = plate.upper()
-    if len(queue) < garage_capacity:
-        queue.insert(0, plate)
-        log_func(f"✅ {plate} joined the queue.")
-        return current_count + 1
-    else:
-        log_func("❌ Garage is full!")
-        return current_count
-
-def depart_middle(queue, target_plate, current_departures, log_func):
-    target_plate = target_plate.upper()
-    if target_plate not in queue:
-        log_func(f"❓ Error: Car '{target_plate}' not found.")
-        return current_departures
-
-    temp_buffer = []
-    ops = 0
-    while queue:
-        current = queue.pop()
-        ops += 1
-        if current == target_plate:
-            current_departures += 1
-            log_func(f"🎯 {target_plate} exited the front.")
-            break
-        else:
-            temp_buffer.append(current)
-
-    while temp_buffer:
-        queue.append(temp_buffer.pop())
-        ops += 1
-
-    log_func(f"📊 Total Moves: {ops}")
-    return current_departures
+from garage import GarageQueue
+from log_sink import LogSink
 
 class GarageUI:
     def __init__(self, root):
@@ -48,6 +9,7 @@ class GarageUI:
         self.root.title("FIFO GARAGE (Queue)")
         self.root.geometry("700x600") 
         self.root.configure(bg="#f0f0f0")
+        self.garage = GarageQueue(log=self.write_log)
         
         tk.Label(root, text="FIFO GARAGE (Queue)", font=("Arial", 16, "bold"), bg="#f0f0f0").pack(pady=10)
         
@@ -57,6 +19,13 @@ class GarageUI:
         self.canvas = tk.Canvas(root, bg="white", height=120, highlightthickness=1)
         self.canvas.pack(fill=tk.X, padx=20, pady=10)
         
+        # Canvas items are kept and moved between repaints, not recreated
+        self.car_items = {}  # plate -> [rect id, text id, x, y, car_w]
+        self._redraw_pending = False
+        self.entrance_label = self.canvas.create_text(60, 20, text="(Entrance)", font=("Arial", 10, "bold"))
+        self.exit_label = self.canvas.create_text(0, 20, text="(Exit)", font=("Arial", 10, "bold"))
+        self.empty_label = self.canvas.create_text(0, 0, text="📭 Empty", font=("Arial", 14), fill="gray")
+        
         btn_frame = tk.Frame(root, bg="#f0f0f0")
         btn_frame.pack(pady=10)
         
@@ -68,64 +37,74 @@ class GarageUI:
         tk.Label(root, text="System Logs:", font=("Arial", 10, "bold"), bg="#f0f0f0").pack(anchor="w", padx=20)
         self.log_area = scrolledtext.ScrolledText(root, height=10, state='disabled', font=("Consolas", 10))
         self.log_area.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+        self.log_sink = LogSink(self.log_area)
         
         self.update_display()
 
     def write_log(self, message):
-        """Adds a message to the UI log area."""
-        self.log_area.configure(state='normal') # Enable editing
-        self.log_area.insert(tk.END, message + "\n") # Add message
-        self.log_area.see(tk.END) # Scroll to bottom
-        self.log_area.configure(state='disabled') # Disable editing
-        print(message) # Still print to terminal for backup
+        """Queues a message for the UI log area (and the terminal)."""
+        self.log_sink.write(message)
 
     def arrive_action(self):
-        global total_arrivals
         plate = simpledialog.askstring("Arrive", "Enter Plate:")
         if plate and plate.strip():
-            total_arrivals = arrive(garage_queue, plate.strip(), total_arrivals, self.write_log)
+            self.garage.arrive(plate.strip())
             self.update_display()
     
     def depart_action(self):
-        global total_departures
-        if not garage_queue:
+        if not self.garage:
             self.write_log("📭 Empty.")
             return
         
         target = simpledialog.askstring("Depart", "Plate to remove:")
         if target and target.strip():
-            total_departures = depart_middle(garage_queue, target.strip(), total_departures, self.write_log)
+            self.garage.depart(target.strip())
             self.update_display()
     
     def reset_garage(self):
-        global total_arrivals, total_departures
-        garage_queue.clear()
-        total_arrivals = 0
-        total_departures = 0
-        self.log_area.configure(state='normal')
-        self.log_area.delete('1.0', tk.END)
-        self.log_area.configure(state='disabled')
+        self.garage.reset()
+        self.log_sink.clear()
         self.update_display()
         self.write_log("System Reset.")
 
     def update_display(self):
-        self.stats_label.config(text=f"Arrivals: {total_arrivals} | Departures: {total_departures}")
-        self.canvas.delete("all")
-        w = self.canvas.winfo_width() if self.canvas.winfo_width() > 1 else 660
-        h = self.canvas.winfo_height() if self.canvas.winfo_height() > 1 else 120
-        
-        self.canvas.create_text(60, 20, text="(Entrance)", font=("Arial", 10, "bold"))
-        self.canvas.create_text(w - 60, 20, text="(Exit)", font=("Arial", 10, "bold"))
-        
-        if garage_queue:
-            car_w = min(70, (w - 140) // len(garage_queue) - 5)
+        """Schedules one repaint; a burst of operations is coalesced into it."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self.render)
+
+    def render(self):
+        self._redraw_pending = False
+        garage = self.garage
+        canvas = self.canvas
+        self.stats_label.config(text=f"Arrivals: {garage.arrivals} | Departures: {garage.departures}")
+        w = canvas.winfo_width() if canvas.winfo_width() > 1 else 660
+        h = canvas.winfo_height() if canvas.winfo_height() > 1 else 120
+        canvas.coords(self.exit_label, w - 60, 20)
+
+        # Delete only the cars that departed
+        for plate in [p for p in self.car_items if p not in garage]:
+            rect, text = self.car_items.pop(plate)[:2]
+            canvas.delete(rect, text)
+
+        if garage:
+            car_w = min(70, (w - 140) // len(garage) - 5)
             y = h // 2
-            for i, plate in enumerate(garage_queue):
+            for i, plate in enumerate(garage):  # entrance -> exit
                 x = 70 + i * (car_w + 5)
-                self.canvas.create_rectangle(x, y - 20, x + car_w, y + 20, fill="#4a90e2", outline="black")
-                self.canvas.create_text(x + car_w // 2, y, text=plate, font=("Arial", 9, "bold"), fill="white")
+                item = self.car_items.get(plate)
+                if item is None:
+                    rect = canvas.create_rectangle(x, y - 20, x + car_w, y + 20, fill="#4a90e2", outline="black")
+                    text = canvas.create_text(x + car_w // 2, y, text=plate, font=("Arial", 9, "bold"), fill="white")
+                    self.car_items[plate] = [rect, text, x, y, car_w]
+                elif item[2:] != [x, y, car_w]:
+                    canvas.coords(item[0], x, y - 20, x + car_w, y + 20)
+                    canvas.coords(item[1], x + car_w // 2, y)
+                    item[2:] = [x, y, car_w]
+            canvas.itemconfigure(self.empty_label, state="hidden")
         else:
-            self.canvas.create_text(w // 2, h // 2, text="📭 Empty", font=("Arial", 14), fill="gray")
+            canvas.coords(self.empty_label, w // 2, h // 2)
+            canvas.itemconfigure(self.empty_label, state="normal")
 
 if __name__ == "__main__":
     root = tk.Tk()
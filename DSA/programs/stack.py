@@ -1,49 +1,7 @@
 import tkinter as tk
 from tkinter import simpledialog, scrolledtext
-
-# --- GLOBAL DATA ---
-garage_stack = []
-garage_capacity = 10
-total_arrivals = 0
-total_departures = 0
-
-def arrive(stack, plate, current_count, log_func):
-    plate = plate.upper()
-    if len(stack) < garage_capacity:
-        stack.insert(0, plate)  # Add to the left (Top of stack)
-        log_func(f"✅ {plate} parked at the TOP.")
-        return current_count + 1
-    else:
-        log_func("❌ Garage is full!")
-        return current_count
-
-def depart_middle(stack, target_plate, current_departures, log_func):
-    target_plate = target_plate.upper()
-    if target_plate not in stack:
-        log_func(f"❓ Error: Car '{target_plate}' not found.")
-        return current_departures
-
-    temp_stack = []
-    ops = 0
-
-    # LIFO: We start looking from the TOP (index 0)
-    while stack:
-        current = stack.pop(0) 
-        ops += 1
-        if current == target_plate:
-            current_departures += 1
-            log_func(f"🎯 {target_plate} departed.")
-            break
-        else:
-            temp_stack.append(current)
-
-    # Restack back to the Top (reversing the temp stack to maintain order)
-    while temp_stack:
-        stack.insert(0, temp_stack.pop())
-        ops += 1
-
-    log_func(f"📊 Total Moves: {ops}")
-    return current_departures
+from garage import GarageStack
+from log_sink import LogSink
 
 # GUI Wrapper
 class GarageUI:
@@ -52,6 +10,7 @@ class GarageUI:
         self.root.title("LIFO GARAGE (Stack)")
         self.root.geometry("500x700") 
         self.root.configure(bg="#f0f0f0")
+        self.garage = GarageStack(log=self.write_log)
         
         tk.Label(root, text="LIFO GARAGE (Stack)", font=("Arial", 16, "bold"),
                  bg="#f0f0f0").pack(pady=10)
@@ -63,6 +22,14 @@ class GarageUI:
         self.canvas = tk.Canvas(root, bg="white", highlightthickness=1)
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
+        # Canvas items are kept and moved between repaints, not recreated
+        self.car_items = {}  # plate -> [rect id, text id, x, y]
+        self._redraw_pending = False
+        self.top_label = self.canvas.create_text(0, 20, text="(Top/Exit)", font=("Arial", 10, "bold"))
+        self.bottom_label = self.canvas.create_text(0, 0, text="(Bottom)", font=("Arial", 10, "bold"))
+        self.empty_label = self.canvas.create_text(0, 100, text="📭 Empty",
+                                                   font=("Arial", 14), fill="gray")
+        
         btn_frame = tk.Frame(root, bg="#f0f0f0")
         btn_frame.pack(pady=10)
         
@@ -77,83 +44,90 @@ class GarageUI:
         tk.Label(root, text="System Logs:", font=("Arial", 10, "bold"), bg="#f0f0f0").pack(anchor="w", padx=20)
         self.log_area = scrolledtext.ScrolledText(root, height=8, state='disabled', font=("Consolas", 10))
         self.log_area.pack(fill=tk.X, padx=20, pady=(0, 20))
+        self.log_sink = LogSink(self.log_area)
 
         self.update_display()
 
     def write_log(self, message):
-        """Adds a message to the UI log area."""
-        self.log_area.configure(state='normal') 
-        self.log_area.insert(tk.END, message + "\n") 
-        self.log_area.see(tk.END) 
-        self.log_area.configure(state='disabled') 
-        print(message) # Backup print
+        """Queues a message for the UI log area (and the terminal)."""
+        self.log_sink.write(message)
 
     def arrive_action(self):
-        global garage_stack, total_arrivals
         plate = simpledialog.askstring("Arrive", "Enter Plate:")
         if plate and plate.strip():
-            total_arrivals = arrive(garage_stack, plate.strip(), total_arrivals, self.write_log)
+            self.garage.arrive(plate.strip())
             self.update_display()
     
     def depart_action(self):
-        global garage_stack, total_departures
-        if not garage_stack:
+        if not self.garage:
             self.write_log("📭 Empty.")
             return
         
         target = simpledialog.askstring("Depart", "Plate to remove:")
         if target and target.strip():
-            total_departures = depart_middle(garage_stack, target.strip(), total_departures, self.write_log)
+            self.garage.depart(target.strip())
             self.update_display()
     
     def reset_garage(self):
-        global garage_stack, total_arrivals, total_departures
-        garage_stack.clear()
-        total_arrivals = 0
-        total_departures = 0
-        self.log_area.configure(state='normal')
-        self.log_area.delete('1.0', tk.END)
-        self.log_area.configure(state='disabled')
+        self.garage.reset()
+        self.log_sink.clear()
         self.update_display()
         self.write_log("System Reset.")
     
     def update_display(self):
-        global garage_stack, total_arrivals, total_departures, garage_capacity
+        """Schedules one repaint; a burst of operations is coalesced into it."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self.render)
+    
+    def render(self):
+        self._redraw_pending = False
+        garage = self.garage
+        canvas = self.canvas
         
         self.stats_label.config(
-            text=f"Arrivals: {total_arrivals} | Departures: {total_departures}"
+            text=f"Arrivals: {garage.arrivals} | Departures: {garage.departures}"
         )
         
-        self.canvas.delete("all")
+        w = canvas.winfo_width() if canvas.winfo_width() > 1 else 460
+        canvas.coords(self.top_label, w // 2, 20)
+        
+        # Delete only the cars that departed
+        for plate in [p for p in self.car_items if p not in garage]:
+            rect, text, _, _ = self.car_items.pop(plate)
+            canvas.delete(rect, text)
         
-        w = self.canvas.winfo_width() if self.canvas.winfo_width() > 1 else 460
-        # Calculate height dynamically based on canvas size
+        car_w = 150
+        car_h = 30 # Made slightly smaller to fit more cars
+        spacing = 5
+        start_y = 40
+        x = (w - car_w) // 2
         
-        # TOP label matching original: (Top/Exit)
-        self.canvas.create_text(w // 2, 20, text="(Top/Exit)", font=("Arial", 10, "bold"))
+        for i, plate in enumerate(garage):
+            y = start_y + i * (car_h + spacing)
+            item = self.car_items.get(plate)
+            if item is None:
+                rect = canvas.create_rectangle(x, y, x + car_w, y + car_h,
+                                               fill="#e74c3c", outline="black")
+                text = canvas.create_text(x + car_w // 2, y + car_h // 2, text=plate,
+                                          font=("Arial", 10, "bold"), fill="white")
+                self.car_items[plate] = [rect, text, x, y]
+            elif item[2] != x or item[3] != y:
+                canvas.coords(item[0], x, y, x + car_w, y + car_h)
+                canvas.coords(item[1], x + car_w // 2, y + car_h // 2)
+                item[2], item[3] = x, y
         
-        if garage_stack:
-            car_w = 150
-            car_h = 30 # Made slightly smaller to fit more cars
-            spacing = 5
-            start_y = 40
-            
-            for i, plate in enumerate(garage_stack):
-                x = (w - car_w) // 2
-                y = start_y + i * (car_h + spacing)
-                
-                self.canvas.create_rectangle(x, y, x + car_w, y + car_h,
-                                            fill="#e74c3c", outline="black")
-                self.canvas.create_text(x + car_w // 2, y + car_h // 2, text=plate,
-                                       font=("Arial", 10, "bold"), fill="white")
-            
+        if garage:
             # BOTTOM label
-            bottom_y = start_y + len(garage_stack) * (car_h + spacing) + 15
-            self.canvas.create_text(w // 2, bottom_y, text="(Bottom)", font=("Arial", 10, "bold"))
+            bottom_y = start_y + len(garage) * (car_h + spacing) + 15
+            canvas.coords(self.bottom_label, w // 2, bottom_y)
+            canvas.itemconfigure(self.bottom_label, state="normal")
+            canvas.itemconfigure(self.empty_label, state="hidden")
         else:
             # Center the empty text roughly in the middle of the available canvas
-            self.canvas.create_text(w // 2, 100, text="📭 Empty",
-                                   font=("Arial", 14), fill="gray")
+            canvas.coords(self.empty_label, w // 2, 100)
+            canvas.itemconfigure(self.bottom_label, state="hidden")
+            canvas.itemconfigure(self.empty_label, state="normal")
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,18 +1,49 @@
+import time
 import tkinter as tk
+from itertools import islice
 from tkinter import messagebox, simpledialog
-import time
+
+MAX_DISCS = 20
+TURBO_FRAME_MS = 33 # Turbo redraws about 30 times a second...
+TURBO_WORK_MS = 25 # ...after applying as many moves as fit in this budget
+TURBO_BATCH = 1024 # Moves applied between clock checks
+
+def hanoi_moves(n, source=0, target=2, auxiliary=1):
+    """Yields the (from peg, to peg) moves that solve n discs, in order.
+
+    Same order as the classic recursion, but driven by an explicit stack so
+    the caller can take one move at a time.
+    """
+    stack = [(n, source, target, auxiliary, False)]
+    while stack:
+        k, src, dst, aux, move_now = stack.pop()
+        if move_now:
+            yield src, dst
+        elif k > 0:
+            stack.append((k - 1, aux, dst, src, False))
+            stack.append((k, src, dst, aux, True))
+            stack.append((k - 1, src, aux, dst, False))
+
+def move_delay_ms(speed):
+    """Milliseconds between auto-solve moves: slider 1 = slow (0.72s), 10 = no delay."""
+    return max(0, 800 - speed * 80)
 
 class HanoiApp:
     def __init__(self, root, n=5):
         self.root = root
         self.root.title("Tower of Hanoi App")
         self.n = n
+        self.solver = None # hanoi_moves generator while auto-solving
+        self.after_id = None # Pending solver tick
+        self.paused = False
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.main_frame = tk.Frame(root, bg="#e6f2ff")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
         self.setup_menu()
 
     def setup_menu(self):
         """Clears the screen and shows the main menu."""
+        self.stop_solver()
         for widget in self.main_frame.winfo_children():
             widget.destroy()
             
@@ -60,7 +91,19 @@ class HanoiApp:
             self.speed_scale = tk.Scale(speed_frame, from_=1, to=10, orient=tk.HORIZONTAL, 
                                        length=150, bg="#d0e1f9", highlightthickness=0)
             self.speed_scale.set(5) # Default speed (approx 0.4s)
+            self.speed_scale.configure(command=self.on_speed_change)
             self.speed_scale.pack(side=tk.LEFT, padx=5)
+
+            self.pause_btn = tk.Button(self.top_bar, text="Pause", width=7, command=self.toggle_pause,
+                                       font=("Arial", 10, "bold"))
+            self.pause_btn.pack(side=tk.LEFT, padx=5, pady=10)
+            self.step_btn = tk.Button(self.top_bar, text="Step", width=7, command=self.step,
+                                      font=("Arial", 10, "bold"), state=tk.DISABLED)
+            self.step_btn.pack(side=tk.LEFT, padx=5, pady=10)
+            # Turbo: many moves per frame, on by default where one move per frame would crawl
+            self.turbo = tk.BooleanVar(value=self.n > 12)
+            tk.Checkbutton(self.top_bar, text="Turbo", variable=self.turbo, bg="#d0e1f9",
+                           font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=5, pady=10)
         # ====================================================
 
         # Game Canvas
@@ -76,12 +119,12 @@ class HanoiApp:
             self.canvas.bind("<ButtonRelease-1>", self.on_release)
         else:
             self.is_solving = True
-            self.root.after(800, self.start_auto_solve)
+            self.after_id = self.root.after(800, self.start_auto_solve)
 
     def draw_environment(self):
         self.peg_x = [120, 300, 480]
         self.floor_y = 350
-        self.disc_height = 25
+        self.disc_height = min(25, (self.floor_y - 120) // self.n) # Keep tall stacks on the pegs
         self.canvas.create_rectangle(20, self.floor_y, 580, self.floor_y + 15, fill="#808080", outline="#505050")
         for x in self.peg_x:
             self.canvas.create_rectangle(x - 6, 120, x + 6, self.floor_y, fill="#5d5d5d", outline="#333333")
@@ -119,7 +162,8 @@ class HanoiApp:
             max_w = 280
             scale_factor = (max_w - 40) / self.n
             w = (40 + (self.selected_disc * scale_factor)) // 2
-            self.canvas.coords(rect, event.x - w, event.y - 12, event.x + w, event.y + 12)
+            h = self.disc_height // 2
+            self.canvas.coords(rect, event.x - w, event.y - h, event.x + w, event.y + h)
 
     def on_release(self, event):
         if hasattr(self, 'selected_disc') and self.selected_disc:
@@ -151,7 +195,6 @@ class HanoiApp:
         x1 = self.peg_x[peg_idx] - width//2
         y1 = self.floor_y - (pos_in_stack + 1) * self.disc_height
         self.canvas.coords(rect, x1, y1, x1 + width, y1 + self.disc_height)
-        self.root.update() # Keeps the UI alive for the slider
 
     def get_peg_from_x(self, x):
         if x < 210: return 0
@@ -159,39 +202,114 @@ class HanoiApp:
         return 2
 
     # --- Solver Logic ---
+    # The solver is a move generator; one Tk timer tick applies one move, so
+    # the event loop (slider, buttons, window close) is never blocked.
     def start_auto_solve(self):
-        try:
-            self.solve_hanoi(self.n, 0, 2, 1)
-            if self.is_solving:
-                messagebox.showinfo("Done", "The computer has finished.")
-                self.setup_menu()
-        except tk.TclError: 
-            pass
-
-    def solve_hanoi(self, n, source, target, auxiliary):
-        if not self.is_solving: return 
-        if n > 0:
-            self.solve_hanoi(n - 1, source, auxiliary, target)
-            if not self.is_solving: return 
-            
-            disc = self.pegs[source].pop()
-            self.pegs[target].append(disc)
-            self.moves += 1
-            self.info_label.config(text=f"Auto-Solving... Moves: {self.moves}")
-            self.update_disc_pos(disc, target)
-            
-            # === DYNAMIC DELAY LOGIC ===
-            # Slider 1 = Slow (0.8s), Slider 10 = Fast (0.0s)
-            if hasattr(self, 'speed_scale'):
-                speed = self.speed_scale.get()
-                # Inverse relationship: Higher speed = Lower delay
-                delay = max(0.0, 0.8 - (speed * 0.08)) 
-                time.sleep(delay)
-            else:
-                time.sleep(0.4)
-            # ===========================
-            
-            self.solve_hanoi(n - 1, auxiliary, target, source)
+        self.after_id = None
+        self.solver = hanoi_moves(self.n, 0, 2, 1)
+        self.paused = False
+        self.schedule_next(0)
+
+    def schedule_next(self, delay):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+        self.after_id = self.root.after(delay, self.tick)
+
+    def tick(self):
+        self.after_id = None
+        if not self.is_solving or self.paused:
+            return
+        if self.turbo.get():
+            if self.turbo_frame():
+                self.schedule_next(TURBO_FRAME_MS - TURBO_WORK_MS)
+        elif self.apply_next_move():
+            self.schedule_next(move_delay_ms(self.speed_scale.get()))
+
+    def turbo_frame(self):
+        """Applies moves for TURBO_WORK_MS, then redraws once.
+
+        Moves only touch self.pegs; at the end of the frame just the discs that
+        moved are repositioned. Returns False once the puzzle is solved.
+        """
+        pegs = self.pegs
+        landed = {} # disc -> peg it ended this frame on
+        deadline = time.perf_counter() + TURBO_WORK_MS / 1000
+        solved = False
+        while not solved and time.perf_counter() < deadline:
+            batch = 0
+            for source, target in islice(self.solver, TURBO_BATCH):
+                disc = pegs[source].pop()
+                pegs[target].append(disc)
+                landed[disc] = target
+                batch += 1
+            self.moves += batch
+            solved = batch < TURBO_BATCH
+
+        for disc, peg in landed.items():
+            self.update_disc_pos(disc, peg)
+        self.info_label.config(text=f"Auto-Solving... Moves: {self.moves}")
+        if solved:
+            self.finish_auto_solve()
+            return False
+        return True
+
+    def apply_next_move(self):
+        """Makes the solver's next move. Returns False once the puzzle is solved."""
+        move = next(self.solver, None)
+        if move is None:
+            self.finish_auto_solve()
+            return False
+        source, target = move
+        disc = self.pegs[source].pop()
+        self.pegs[target].append(disc)
+        self.moves += 1
+        self.info_label.config(text=f"Auto-Solving... Moves: {self.moves}")
+        self.update_disc_pos(disc, target)
+        return True
+
+    def finish_auto_solve(self):
+        self.solver = None
+        self.is_solving = False
+        messagebox.showinfo("Done", "The computer has finished.")
+        self.setup_menu()
+
+    def on_speed_change(self, value):
+        # Re-time the pending move so slowing down or speeding up applies at once.
+        # Turbo frames keep their own fixed pace, so the slider leaves them alone.
+        if self.turbo.get():
+            return
+        if self.after_id is not None and self.solver is not None and not self.paused:
+            self.schedule_next(move_delay_ms(int(value)))
+
+    def toggle_pause(self):
+        if self.solver is None:
+            return
+        self.paused = not self.paused
+        self.pause_btn.config(text="Resume" if self.paused else "Pause")
+        self.step_btn.config(state=tk.NORMAL if self.paused else tk.DISABLED)
+        if self.paused:
+            if self.after_id is not None:
+                self.root.after_cancel(self.after_id)
+                self.after_id = None
+            self.info_label.config(text=f"Paused. Moves: {self.moves}")
+        else:
+            self.schedule_next(0)
+
+    def step(self):
+        """Makes exactly one move while paused."""
+        if self.solver is not None and self.paused:
+            self.apply_next_move()
+
+    def stop_solver(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.solver = None
+        self.is_solving = False
+
+    def on_close(self):
+        self.stop_solver()
+        self.root.destroy()
 
 if __name__ == "__main__":
     temp_root = tk.Tk()
@@ -199,8 +317,8 @@ if __name__ == "__main__":
     temp_root.attributes('-topmost', True)
     
     
-    num_discs = simpledialog.askinteger("Tower of Hanoi", "Enter number of discs (1-12):", 
-                                        minvalue=1, maxvalue=12, parent=temp_root)
+    num_discs = simpledialog.askinteger("Tower of Hanoi", f"Enter number of discs (1-{MAX_DISCS}):", 
+                                        minvalue=1, maxvalue=MAX_DISCS, parent=temp_root)
     
     if num_discs is None:
         temp_root.destroy()
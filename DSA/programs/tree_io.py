@@ -0,0 +1,164 @@
+"""Compact binary save/load for the tree visualizers.
+
+File layout (little-endian):
+
+    header  magic b"DSAT", version (u16), reserved (u16),
+            node count (u64), key count (u64)
+    keys    key count int64s: the keys of the nodes that have one, in preorder
+    shape   one 4-bit nibble per node in preorder, low nibble first:
+            HAS_LEFT | HAS_RIGHT | HAS_KEY
+
+A node costs its 8-byte key plus half a byte of shape; empty placeholder
+nodes (binary_tree's "?") cost only the nibble. load() memory-maps the file,
+views the key block as int64s in place and rebuilds the tree bottom-up in one
+linear pass, so no value is ever parsed.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from itertools import islice
+
+TREE_EXT = ".dsat"
+MAGIC = b"DSAT"
+VERSION = 1
+HAS_LEFT, HAS_RIGHT, HAS_KEY = 1, 2, 4
+
+_HEADER = struct.Struct("<4sHHQQ")
+_LOW_NIBBLE = bytes(b & 15 for b in range(256))
+_HIGH_NIBBLE = bytes(b >> 4 for b in range(256))
+
+
+def save(path, root, key="val"):
+    """Writes the tree under root to path and returns its node count.
+
+    key names the node attribute holding the value; None values are saved as
+    keyless nodes. Raises ValueError for a key outside the int64 range.
+    """
+    def preorder():
+        stack = [root] if root else []
+        while stack:
+            node = stack.pop()
+            left, right = node.left, node.right
+            yield getattr(node, key), left is not None, right is not None
+            if right:
+                stack.append(right)
+            if left:
+                stack.append(left)
+    return _write(path, preorder())
+
+
+def save_heap(path, values):
+    """Like save() for a tree stored heap-style: slot i of values has its
+    children in slots 2i+1 and 2i+2."""
+    n = len(values)
+
+    def preorder():
+        stack = [0] if n else []
+        while stack:
+            i = stack.pop()
+            left, right = 2 * i + 1, 2 * i + 2
+            yield values[i], left < n, right < n
+            if right < n:
+                stack.append(right)
+            if left < n:
+                stack.append(left)
+    return _write(path, preorder())
+
+
+def _write(path, nodes):
+    """Writes (value, has left, has right) triples given in preorder."""
+    keys = array('q')
+    shape = bytearray()
+    count = 0
+    for value, has_left, has_right in nodes:
+        bits = (HAS_LEFT if has_left else 0) | (HAS_RIGHT if has_right else 0)
+        if value is not None:
+            try:
+                keys.append(value)
+            except OverflowError:
+                raise ValueError(f"key {value} does not fit in a signed 64-bit int") from None
+            bits |= HAS_KEY
+        if count & 1:
+            shape[-1] |= bits << 4
+        else:
+            shape.append(bits)
+        count += 1
+
+    if sys.byteorder != "little":
+        keys.byteswap()
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, count, len(keys)))
+        keys.tofile(f)
+        f.write(shape)
+    return count
+
+
+def load(path, make):
+    """Rebuilds a tree written by save() and returns its root (or None).
+
+    make(key, left, right) builds one node once both of its children exist;
+    key is None for keyless nodes. Raises ValueError for a bad file.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if len(mm) < _HEADER.size:
+            raise ValueError(f"{path} is not a tree file")
+        magic, version, _, count, key_count = _HEADER.unpack_from(mm)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a tree file")
+        keys_at = _HEADER.size
+        shape_at = keys_at + 8 * key_count
+        if len(mm) < shape_at + (count + 1) // 2:
+            raise ValueError(f"{path} is truncated")
+
+        # The views must be released before the map can close
+        with memoryview(mm) as view, view[keys_at:shape_at] as raw, \
+                raw.cast('q') as keys, view[shape_at:] as shape:
+            if sys.byteorder != "little":
+                swapped = array('q', keys)
+                swapped.byteswap()
+                return _build(swapped, shape, count, make)
+            return _build(keys, shape, count, make)
+
+
+def _build(keys, shape, count, make):
+    root = None
+    stack = [] # [key, children still to come, left] per unfinished node
+    k = 0
+    packed = bytes(shape)
+    nibbles = bytearray(2 * len(packed)) # Unpacked with two C-level table lookups
+    nibbles[0::2] = packed.translate(_LOW_NIBBLE)
+    nibbles[1::2] = packed.translate(_HIGH_NIBBLE)
+    for bits in islice(nibbles, count):
+        if bits & HAS_KEY:
+            if k == len(keys):
+                raise ValueError("corrupt tree file: more keyed nodes than keys")
+            key = keys[k]
+            k += 1
+        else:
+            key = None
+        if bits & (HAS_LEFT | HAS_RIGHT):
+            stack.append([key, bits & (HAS_LEFT | HAS_RIGHT), None])
+            continue
+
+        # A leaf finishes every ancestor that was only waiting on this subtree
+        node = make(key, None, None)
+        while stack:
+            frame = stack[-1]
+            if frame[1] == HAS_LEFT | HAS_RIGHT:
+                frame[1] = HAS_RIGHT
+                frame[2] = node
+                break
+            stack.pop()
+            if frame[1] == HAS_LEFT:
+                node = make(frame[0], node, None)
+            else:
+                node = make(frame[0], frame[2], node)
+        else:
+            if root is not None:
+                raise ValueError("corrupt tree file: more than one root")
+            root = node
+
+    if stack or k != len(keys):
+        raise ValueError("corrupt tree file: shape and keys disagree")
+    return root